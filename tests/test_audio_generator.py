@@ -1,5 +1,6 @@
 import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -9,6 +10,44 @@ from zundamotion.exceptions import CacheError
 from zundamotion.utils.ffmpeg_params import AudioParams
 
 
+@pytest.fixture(autouse=True)
+def fake_audio_query(monkeypatch):
+    queries = []
+
+    async def _fake_get_audio_query(text, speaker, *_args, **_kwargs):
+        queries.append((text, speaker))
+        return {"accent_phrases": [], "text": text}
+
+    monkeypatch.setattr(
+        "zundamotion.components.audio.generator.get_audio_query",
+        _fake_get_audio_query,
+    )
+    return queries
+
+
+@pytest.fixture
+def fake_voicevox(monkeypatch):
+    fakes = SimpleNamespace(synthesized=[])
+
+    async def _fake_get_speakers_info(_url, **_kwargs):
+        return {3: {"speaker_name": "ずんだもん", "name": "ノーマル"}}
+
+    async def _fake_get_engine_version(*_args, **_kwargs):
+        return "test-engine"
+
+    async def _fake_generate_voice(**kwargs):
+        fakes.synthesized.append(kwargs)
+        Path(kwargs["filepath"]).write_bytes(b"RIFF")
+
+    for name, func in {
+        "get_speakers_info": _fake_get_speakers_info,
+        "get_engine_version": _fake_get_engine_version,
+        "generate_voice": _fake_generate_voice,
+    }.items():
+        monkeypatch.setattr(f"zundamotion.components.audio.generator.{name}", func)
+    return fakes
+
+
 class StubCacheManager:
     async def get_or_create_media_duration(self, _path: Path) -> float:
         return 1.23
@@ -41,6 +80,7 @@ class ReusingCacheManager(StubCacheManager):
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
         self.created = 0
+        self.created_names = []
         self._cache = {}
 
     async def get_or_create(self, *, key_data, file_name, extension, creator_func):
@@ -48,6 +88,7 @@ class ReusingCacheManager(StubCacheManager):
         if key in self._cache:
             return self._cache[key]
         self.created += 1
+        self.created_names.append(file_name)
         out_path = self.base_dir / f"{file_name}_{self.created}.{extension}"
         result = await creator_func(out_path)
         self._cache[key] = result
@@ -333,6 +374,474 @@ def test_voice_cache_reuses_same_text_across_output_names(monkeypatch, tmp_path)
 
         assert first == second
         assert first.name.startswith("voice_speech_")
-        assert cache_manager.created == 1
+        assert cache_manager.created_names == ["voice_speech", "voice_query"]
+
+    asyncio.run(_run())
+
+
+def test_voice_layers_synthesize_concurrently_in_layer_order(
+    monkeypatch, tmp_path, fake_voicevox
+):
+    async def _run() -> None:
+        cache_manager = ReusingCacheManager(tmp_path)
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True, "url": "http://voicevox:50021"}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=cache_manager,
+        )
+        active = 0
+        peak = 0
+
+        async def fake_generate_voice(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            Path(kwargs["filepath"]).write_bytes(b"RIFF")
+
+        mixed_tracks = []
+
+        async def fake_mix_audio_tracks(tracks, output_path, **_kwargs):
+            mixed_tracks.extend(tracks)
+            Path(output_path).write_bytes(b"RIFF")
+
+        for name, func in {
+            "generate_voice": fake_generate_voice,
+            "mix_audio_tracks": fake_mix_audio_tracks,
+        }.items():
+            monkeypatch.setattr(f"zundamotion.components.audio.generator.{name}", func)
+
+        _path, voice_usage, segments = await generator.generate_audio(
+            "",
+            {
+                "speaker_id": 3,
+                "voice_layers": [
+                    {"text": "一つ目", "start_time": 0.0},
+                    {"text": "二つ目", "start_time": 0.5},
+                ],
+            },
+            "scene1_1",
+        )
+
+        assert peak == 2
+        assert voice_usage == [(3, "一つ目"), (3, "二つ目")]
+        assert [seg["layer_origin"] for seg in segments] == [0, 1]
+        assert [track[1] for track in mixed_tracks] == [0.0, 0.5]
+
+    asyncio.run(_run())
+
+
+def test_voice_layer_fan_out_is_bounded_by_layer_workers(
+    monkeypatch, tmp_path, fake_voicevox
+):
+    async def _run() -> None:
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True, "url": "http://voicevox:50021"}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=ReusingCacheManager(tmp_path),
+            layer_workers=1,
+        )
+        active = 0
+        peak = 0
+
+        async def fake_generate_voice(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            Path(kwargs["filepath"]).write_bytes(b"RIFF")
+
+        async def fake_mix_audio_tracks(_tracks, output_path, **_kwargs):
+            Path(output_path).write_bytes(b"RIFF")
+
+        for name, func in {
+            "generate_voice": fake_generate_voice,
+            "mix_audio_tracks": fake_mix_audio_tracks,
+        }.items():
+            monkeypatch.setattr(f"zundamotion.components.audio.generator.{name}", func)
+
+        _path, voice_usage, _segments = await generator.generate_audio(
+            "",
+            {
+                "speaker_id": 3,
+                "voice_layers": [{"text": f"レイヤー{i}"} for i in range(3)],
+            },
+            "scene1_1",
+        )
+
+        assert peak == 1
+        assert [text for _speaker, text in voice_usage] == [
+            "レイヤー0",
+            "レイヤー1",
+            "レイヤー2",
+        ]
+
+    asyncio.run(_run())
+
+
+def test_nested_voice_layers_do_not_deadlock_with_single_layer_worker(
+    monkeypatch, tmp_path, fake_voicevox
+):
+    async def _run() -> None:
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True, "url": "http://voicevox:50021"}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=ReusingCacheManager(tmp_path),
+            layer_workers=1,
+        )
+
+        async def fake_mix_audio_tracks(_tracks, output_path, **_kwargs):
+            Path(output_path).write_bytes(b"RIFF")
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        mixed_path, voice_usage, _segments = await asyncio.wait_for(
+            generator.generate_audio(
+                "",
+                {
+                    "speaker_id": 3,
+                    "voice_layers": [
+                        {"voice_layers": [{"text": "内側1"}, {"text": "内側2"}]},
+                        {"text": "外側"},
+                    ],
+                },
+                "scene1_1",
+            ),
+            timeout=5,
+        )
+
+        assert mixed_path.exists()
+        assert [text for _speaker, text in voice_usage] == ["内側1", "内側2", "外側"]
+
+    asyncio.run(_run())
+
+
+def test_empty_text_sound_effects_are_probed_once_per_line(monkeypatch, tmp_path):
+    async def _run() -> None:
+        probed = []
+
+        class CountingCacheManager(StubCacheManager):
+            async def get_or_create_media_duration(self, path: Path) -> float:
+                probed.append(Path(path).name)
+                return 2.0
+
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=CountingCacheManager(),
+        )
+        silent_calls = []
+        mixed = []
+
+        async def fake_create_silent_audio(output_path, duration, *_args, **_kwargs):
+            silent_calls.append(duration)
+
+        async def fake_mix_audio_tracks(tracks, output_path, **kwargs):
+            mixed.append((tracks, kwargs["total_duration"]))
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.create_silent_audio",
+            fake_create_silent_audio,
+        )
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        se_path = tmp_path / "missing_se.wav"
+        await generator.generate_audio(
+            "",
+            {"sound_effects": [{"path": str(se_path), "start_time": 0.5, "volume": 0.8}]},
+            "scene1_1",
+        )
+
+        assert probed == ["missing_se.wav"]
+        assert silent_calls == [2.5]
+        assert mixed[0][0][1] == (str(se_path), 0.5, 0.8)
+        assert mixed[0][1] == 2.5
+
+    asyncio.run(_run())
+
+
+def test_speech_and_sound_effect_mix_is_reused_from_cache(monkeypatch, tmp_path):
+    async def _run() -> None:
+        cache_manager = ReusingCacheManager(tmp_path)
+        generator = AudioGenerator(
+            config={"voice": {"enabled": False}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=cache_manager,
+        )
+        mix_calls = []
+
+        async def fake_create_silent_audio(*_args, **_kwargs):
+            return None
+
+        async def fake_mix_audio_tracks(tracks, output_path, **_kwargs):
+            mix_calls.append(output_path)
+            Path(output_path).write_bytes(b"RIFF")
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.create_silent_audio",
+            fake_create_silent_audio,
+        )
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        se_path = tmp_path / "se.wav"
+        se_path.write_bytes(b"RIFF")
+        line = {"sound_effects": [{"path": str(se_path), "start_time": 0.2}]}
+
+        first, _, _ = await generator.generate_audio("こんにちは", line, "scene1_1")
+        second, _, _ = await generator.generate_audio("こんにちは", line, "scene1_1")
+
+        assert first == second
+        assert len(mix_calls) == 1
+
+        se_path.write_bytes(b"RIFF-changed")
+        await generator.generate_audio("こんにちは", line, "scene1_1")
+        assert len(mix_calls) == 2
+
+    asyncio.run(_run())
+
+
+def test_failed_speech_and_sound_effect_mix_is_not_cached(monkeypatch, tmp_path):
+    from zundamotion.cache import CacheManager
+
+    async def _run() -> None:
+        cache_manager = CacheManager(tmp_path / "cache")
+
+        async def fake_media_duration(_path, *_args, **_kwargs):
+            return 0.5
+
+        cache_manager.get_or_create_media_duration = fake_media_duration
+        temp_dir = tmp_path / "temp"
+        temp_dir.mkdir()
+        generator = AudioGenerator(
+            config={"voice": {"enabled": False}},
+            temp_dir=temp_dir,
+            audio_params=AudioParams(),
+            cache_manager=cache_manager,
+        )
+        mix_calls = []
+
+        async def fake_create_silent_audio(output_path, *_args, **_kwargs):
+            Path(output_path).write_bytes(b"RIFF")
+
+        async def fake_mix_audio_tracks(tracks, output_path, **_kwargs):
+            mix_calls.append(output_path)
+            Path(output_path).write_bytes(b"RIFF-partial")
+            if len(mix_calls) == 1:
+                raise RuntimeError("ffmpeg crashed")
+            Path(output_path).write_bytes(b"RIFF-mixed")
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.create_silent_audio",
+            fake_create_silent_audio,
+        )
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        se_path = tmp_path / "se.wav"
+        se_path.write_bytes(b"RIFF")
+        line = {"sound_effects": [{"path": str(se_path), "start_time": 0.2}]}
+
+        with pytest.raises(CacheError, match="ffmpeg crashed"):
+            await generator.generate_audio("こんにちは", line, "scene1_1")
+        assert not list((tmp_path / "cache").glob("speech_se_mix_*"))
+        assert not Path(mix_calls[0]).exists()
+
+        mixed, _, _ = await generator.generate_audio("こんにちは", line, "scene1_1")
+
+        assert len(mix_calls) == 2
+        assert mixed.parent == tmp_path / "cache"
+        assert mixed.read_bytes() == b"RIFF-mixed"
+
+    asyncio.run(_run())
+
+
+def test_silent_lines_with_same_duration_share_one_ffmpeg_render(monkeypatch, tmp_path):
+    async def _run() -> None:
+        generator = AudioGenerator(
+            config={"voice": {"enabled": False}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=StubCacheManager(),
+        )
+        calls = []
+
+        async def fake_create_silent_audio(output_path, duration, *_args, **_kwargs):
+            calls.append((output_path, duration))
+            Path(output_path).write_bytes(b"RIFF-silence")
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.create_silent_audio",
+            fake_create_silent_audio,
+        )
+
+        line = {"duration": 1.5}
+        first, _, _ = await generator.generate_audio("", line, "scene1_1")
+        second, _, _ = await generator.generate_audio("", line, "scene1_2")
+        third, _, _ = await generator.generate_audio("", {"duration": 2.0}, "scene1_3")
+
+        assert first == tmp_path / "scene1_1_speech.wav"
+        assert second == tmp_path / "scene1_2_speech.wav"
+        assert second.read_bytes() == b"RIFF-silence"
+        assert third.exists()
+        assert [duration for _path, duration in calls] == [1.5, 2.0]
+
+    asyncio.run(_run())
+
+
+def test_repeated_sound_effect_in_one_line_is_probed_once(tmp_path):
+    async def _run() -> None:
+        probed = []
+
+        class CountingCacheManager(StubCacheManager):
+            async def get_or_create_media_duration(self, path: Path) -> float:
+                probed.append(Path(path).name)
+                await asyncio.sleep(0)
+                return 0.5
+
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=CountingCacheManager(),
+        )
+        se_path = tmp_path / "knock.wav"
+        se_path.write_bytes(b"RIFF")
+
+        durations = await generator._sound_effect_durations(
+            [{"path": str(se_path)}, {"path": str(se_path), "start_time": 1.0}]
+        )
+
+        assert durations == [0.5, 0.5]
+        assert probed == ["knock.wav"]
+
+    asyncio.run(_run())
+
+
+def test_speed_change_reuses_cached_audio_query(tmp_path, fake_audio_query, fake_voicevox):
+    async def _run() -> None:
+        cache_manager = ReusingCacheManager(tmp_path)
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True, "speaker": 3}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=cache_manager,
+        )
+
+        await generator.generate_audio("こんにちは", {"speed": 1.0}, "scene1_1")
+        await generator.generate_audio("こんにちは", {"speed": 1.2}, "scene1_2")
+
+        synthesized = fake_voicevox.synthesized
+        assert fake_audio_query == [("こんにちは", 3)]
+        assert [call["speed"] for call in synthesized] == [1.0, 1.2]
+        assert synthesized[1]["audio_query"] == {"accent_phrases": [], "text": "こんにちは"}
+
+    asyncio.run(_run())
+
+
+def test_sound_effect_driven_silence_is_quantized_for_reuse(monkeypatch, tmp_path):
+    async def _run() -> None:
+        durations = iter([1.234, 1.236])
+
+        class VaryingCacheManager(StubCacheManager):
+            async def get_or_create_media_duration(self, _path: Path) -> float:
+                return next(durations)
+
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True, "estimate_min_duration": 0.5}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=VaryingCacheManager(),
+        )
+        silent_calls = []
+        mix_durations = []
+
+        async def fake_create_silent_audio(output_path, duration, *_args, **_kwargs):
+            silent_calls.append(duration)
+            Path(output_path).write_bytes(b"RIFF")
+
+        async def fake_mix_audio_tracks(*_args, **kwargs):
+            mix_durations.append(kwargs["total_duration"])
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.create_silent_audio",
+            fake_create_silent_audio,
+        )
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        for idx, name in enumerate(("a.wav", "b.wav")):
+            se_path = tmp_path / name
+            se_path.write_bytes(b"RIFF")
+            await generator.generate_audio(
+                "", {"sound_effects": [{"path": str(se_path)}]}, f"scene1_{idx}"
+            )
+
+        assert silent_calls == [1.24]
+        assert mix_durations == [1.234, 1.236]
+
+    asyncio.run(_run())
+
+
+def test_voice_layer_duration_comes_from_synthesis_not_a_second_probe(
+    monkeypatch, tmp_path, fake_voicevox
+):
+    async def _run() -> None:
+        probed = []
+
+        class CountingCacheManager(StubCacheManager):
+            async def get_or_create_media_duration(self, path: Path) -> float:
+                probed.append(Path(path).name)
+                return 1.0
+
+        generator = AudioGenerator(
+            config={"voice": {"enabled": True}},
+            temp_dir=tmp_path,
+            audio_params=AudioParams(),
+            cache_manager=CountingCacheManager(),
+        )
+        mix_calls = []
+
+        async def fake_mix_audio_tracks(tracks, output_path, **kwargs):
+            mix_calls.append(kwargs["total_duration"])
+
+        monkeypatch.setattr(
+            "zundamotion.components.audio.generator.mix_audio_tracks",
+            fake_mix_audio_tracks,
+        )
+
+        await generator.generate_audio(
+            "",
+            {
+                "speaker_id": 3,
+                "voice_layers": [
+                    {"text": "一つ目", "start_time": 0.0},
+                    {"text": "二つ目", "start_time": 0.5},
+                ],
+            },
+            "scene1_1",
+        )
+
+        assert len(probed) == 2
+        assert mix_calls == [1.5]
 
     asyncio.run(_run())
@@ -25,8 +25,9 @@ class StubCacheManager:
         file_name: str,
         extension: str,
         source_path: Path,
-    ) -> None:
+    ) -> Path:
         self._saved[self._key(key_data, file_name, extension)] = Path(source_path)
+        return Path(source_path)
 
     def get_cache_path(
         self, *, key_data: Dict[str, Any], file_name: str, extension: str
@@ -234,6 +235,33 @@ def test_audio_phase_prefetches_audio_generation_concurrently(tmp_path):
     asyncio.run(_run())
 
 
+def test_audio_phase_parses_face_anim_settings_once(monkeypatch, tmp_path):
+    from zundamotion.components.pipeline_phases import audio_phase_face_anim
+
+    config = {
+        "video": {"fps": 24, "face_anim": {"mouth_fps": 12}},
+        "voice": {},
+        "system": {"video_extensions": [".mp4"]},
+    }
+    audio_phase = AudioPhase(config, tmp_path, StubCacheManager(tmp_path), AudioParams())
+    calls = []
+    original = audio_phase_face_anim.FaceAnimSettings.from_config
+
+    def counting_from_config(cfg):
+        calls.append(cfg)
+        return original(cfg)
+
+    monkeypatch.setattr(
+        audio_phase_face_anim.FaceAnimSettings, "from_config", counting_from_config
+    )
+
+    settings = audio_phase.face_anim_settings()
+
+    assert audio_phase.face_anim_settings() is settings
+    assert (settings.mouth_fps, settings.video_fps) == (12, 24)
+    assert len(calls) == 1
+
+
 def test_audio_phase_l_cut_passes_audio_tail_to_next_line(tmp_path):
     async def _run() -> None:
         config = {
@@ -327,3 +355,33 @@ def test_audio_phase_skips_face_anim_for_explicitly_hidden_speaker(tmp_path):
         assert line_data_map["hidden_narration_1"]["face_anim"] is None
 
     asyncio.run(_run())
+
+
+def test_mouth_timeline_runs_off_event_loop_thread(monkeypatch, tmp_path):
+    import threading
+
+    from zundamotion.components.pipeline_phases.audio_phase_face_anim import (
+        FaceAnimSettings,
+        MouthSegmentLoader,
+    )
+
+    config = {"video": {"fps": 30, "face_anim": {}}, "voice": {}, "system": {}}
+    audio_phase = AudioPhase(config, tmp_path, StubCacheManager(tmp_path), AudioParams())
+    audio_path = tmp_path / "line.wav"
+    audio_path.write_bytes(b"wav")
+    threads = []
+
+    def fake_compute_mouth_timeline(_audio_path: Path, **_kwargs) -> List[Dict[str, Any]]:
+        threads.append(threading.current_thread())
+        return [{"start": 0.0, "end": 0.1, "state": "open"}]
+
+    monkeypatch.setattr(
+        "zundamotion.components.pipeline_phases.audio_phase.compute_mouth_timeline",
+        fake_compute_mouth_timeline,
+    )
+    loader = MouthSegmentLoader(audio_phase, "scene_1", FaceAnimSettings.from_config(config))
+
+    segments = asyncio.run(loader.load(audio_path))
+
+    assert segments == [{"start": 0.0, "end": 0.1, "state": "open"}]
+    assert threads and threads[0] is not threading.main_thread()
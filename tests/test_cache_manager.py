@@ -1,8 +1,11 @@
 import asyncio
+import hashlib
+import json
 import os
 from pathlib import Path
 
 import zundamotion.cache as cache_module
+import zundamotion.cache_base as cache_base
 from zundamotion.cache import CacheManager
 
 
@@ -318,3 +321,113 @@ def test_no_cache_reuses_duration_within_ephemeral_dir(tmp_path: Path, monkeypat
         assert not list((tmp_path / "cache").glob("duration_*.json"))
 
     asyncio.run(_run())
+
+
+def test_normalized_precheck_reuses_parsed_sidecar_meta(tmp_path: Path, monkeypatch) -> None:
+    cache = CacheManager(tmp_path / "cache")
+    video = tmp_path / "temp_normalized_x.mp4"
+    video.write_bytes(b"video")
+    meta = tmp_path / "temp_normalized_x.meta.json"
+    meta.write_text('{"target_spec": {"video": {"width": 1280}}}', encoding="utf-8")
+    spec = {"video": {"width": 1280}}
+    original_load = cache_base.json.load
+    loads = 0
+
+    def counting_load(fp):
+        nonlocal loads
+        loads += 1
+        return original_load(fp)
+
+    monkeypatch.setattr(cache_base.json, "load", counting_load)
+
+    for _ in range(3):
+        assert asyncio.run(cache.get_or_create_normalized_video(video, spec)) == video
+    assert loads == 1
+
+
+def test_normalized_hash_matches_full_signature_and_tracks_spec_changes(tmp_path: Path) -> None:
+    cache = CacheManager(tmp_path / "cache")
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    spec = {"video": {"width": 1920, "fps": 30}, "audio": {"sr": 48000}}
+    resolved = video.resolve()
+    st = resolved.stat()
+    signature = {
+        "path": str(resolved),
+        "mtime": int(st.st_mtime),
+        "size": st.st_size,
+        "target": spec,
+    }
+    expected = hashlib.sha256(
+        json.dumps(signature, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+    assert cache._hash_for_normalized(video, spec) == expected
+    assert cache._hash_for_normalized(video, spec) == expected
+
+    spec["audio"]["sr"] = 44100
+    assert cache._hash_for_normalized(video, spec) != expected
+
+    # 30 と 30.0 は == では等しいが直列化結果が異なるため、key も変わる。
+    spec["video"]["fps"] = 30.0
+    assert cache._hash_for_normalized(video, spec) == CacheManager(
+        tmp_path / "fresh"
+    )._hash_for_normalized(video, spec)
+
+
+def test_judge_need_encode_matches_and_short_circuits_on_first_mismatch(tmp_path: Path) -> None:
+    cache = CacheManager(tmp_path / "cache")
+    spec = {
+        "video": {"width": 1920, "height": 1080, "fps": 30, "pix_fmt": "yuv420p"},
+        "audio": {"sr": 48000, "ch": 2},
+    }
+    current = {
+        "width": 1920,
+        "height": 1080,
+        "fps": 30.0,
+        "pix_fmt": "yuv420p",
+        "asr": 48000,
+        "ach": 2,
+    }
+
+    assert cache._judge_need_encode(current, spec, prefer_copy=True) == (False, True)
+    assert cache._judge_need_encode(current, spec, prefer_copy=False) == (False, False)
+    # fps が欠けていても、先に幅が不一致なら int 変換まで進まない。
+    mismatched = {"width": 1280, "fps": None}
+    assert cache._judge_need_encode(mismatched, spec, prefer_copy=True) == (True, False)
+
+
+def test_cache_key_path_resolution_is_memoized(tmp_path: Path, monkeypatch) -> None:
+    cache = CacheManager(tmp_path / "cache")
+    audio = tmp_path / "voice.wav"
+    audio.write_bytes(b"wav")
+    original_realpath = cache_base.os.path.realpath
+    calls: list[str] = []
+
+    def counting_realpath(path, *args, **kwargs):
+        calls.append(str(path))
+        return original_realpath(path, *args, **kwargs)
+
+    monkeypatch.setattr(cache_base.os.path, "realpath", counting_realpath)
+
+    first = cache._generate_hash({"audio_path": str(audio)})
+    second = cache._generate_hash({"audio_path": str(audio)})
+
+    assert first == second
+    assert calls == [str(audio)]
+
+
+def test_generate_hash_matches_json_dumps_with_path_encoder(tmp_path):
+    cache = CacheManager(tmp_path / "cache")
+    key_data = {"b": [1, 2], "a": Path("/tmp/x.wav"), "text": "ずんだ"}
+
+    wrapped = {
+        "__cache_key_version": "20260510_media_content_signature_v1",
+        "data": cache._augment_file_signatures_for_hash(key_data),
+    }
+    expected = hashlib.sha256(
+        json.dumps(wrapped, sort_keys=True, cls=cache_base._PathEncoder).encode("utf-8")
+    ).hexdigest()
+
+    assert cache._generate_hash(key_data) == expected
+    assert cache._generate_hash(key_data) == expected
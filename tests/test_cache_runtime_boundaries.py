@@ -4,9 +4,12 @@ import asyncio
 import json
 import os
 import re
+import threading
 from pathlib import Path
 
 import zundamotion.cache as cache_module
+import zundamotion.cache_runtime as cache_runtime_module
+import zundamotion.cache_storage as cache_storage
 from zundamotion.cache import CacheManager
 from zundamotion.cache_base import CacheManager as BaseCacheManager
 
@@ -21,6 +24,19 @@ def test_runtime_hash_matches_legacy_cache_key_for_image(tmp_path: Path) -> None
     assert runtime._generate_hash(key_data) == legacy._generate_hash(key_data)
 
 
+def test_base_and_runtime_managers_start_on_a_non_empty_cache_dir(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    expired = cache_dir / "old_entry.wav"
+    expired.write_bytes(b"old")
+    os.utime(expired, (0, 0))
+
+    for manager_cls in (BaseCacheManager, cache_runtime_module.CacheManager):
+        manager = manager_cls(cache_dir, ttl_hours=1, max_size_mb=1)
+        manager.flush_cache_cleanup()
+        manager._clean_cache()
+
+
 def test_image_signature_sha_is_memoized_and_stat_change_invalidates(tmp_path: Path) -> None:
     image = tmp_path / "asset.png"
     image.write_bytes(b"first")
@@ -129,6 +145,94 @@ def test_cache_latency_stages_are_recorded(tmp_path: Path, monkeypatch) -> None:
     assert "path_existence" in stages
 
 
+def test_cache_file_skips_copy_when_same_size_entry_exists(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"payload")
+    os.utime(source, (1_000_000, 1_000_000))
+    manager = CacheManager(tmp_path / "cache")
+    written = manager.cache_file(source, {"value": "x"}, "sample", "bin")
+    copies: list[tuple[Path, Path]] = []
+    monkeypatch.setattr(
+        cache_runtime_module.shutil,
+        "copy",
+        lambda src, dst: copies.append((src, dst)),
+    )
+
+    assert manager.cache_file(source, {"value": "x"}, "sample", "bin") == written
+    assert copies == []
+
+    refreshing = CacheManager(tmp_path / "cache", cache_refresh=True)
+    refreshing.cache_file(source, {"value": "x"}, "sample", "bin")
+    assert copies == [(source, written)]
+
+
+def test_cache_file_recopies_a_regenerated_same_size_source(tmp_path: Path) -> None:
+    source = tmp_path / "line_audio.wav"
+    source.write_bytes(b"old-voice")
+    os.utime(source, (1_000_000, 1_000_000))
+    manager = CacheManager(tmp_path / "cache")
+    written = manager.cache_file(source, {"value": "line"}, "sample", "wav")
+
+    # エンジン更新後に同じ尺で作り直された音声は、サイズが同じでも保存し直す。
+    source.write_bytes(b"new-voice")
+    cached_mtime_ns = written.stat().st_mtime_ns
+    os.utime(source, ns=(cached_mtime_ns + 1_000_000, cached_mtime_ns + 1_000_000))
+
+    assert manager.cache_file(source, {"value": "line"}, "sample", "wav") == written
+    assert written.read_bytes() == b"new-voice"
+
+
+def test_cache_file_does_not_alias_the_source(tmp_path: Path) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"payload")
+    manager = CacheManager(tmp_path / "cache")
+
+    written = manager.cache_file(source, {"value": "copy"}, "sample", "bin")
+
+    assert not os.path.samefile(source, written)
+    source.write_bytes(b"rewritten")
+    assert written.read_bytes() == b"payload"
+
+
+def test_get_or_create_moves_output_written_elsewhere(tmp_path: Path) -> None:
+    manager = CacheManager(tmp_path / "cache")
+    elsewhere = tmp_path / "elsewhere.bin"
+
+    async def creator(_output_path: Path) -> Path:
+        elsewhere.write_bytes(b"payload")
+        return elsewhere
+
+    cached = asyncio.run(
+        manager.get_or_create(
+            key_data={"value": "move"},
+            file_name="sample",
+            extension="bin",
+            creator_func=creator,
+        )
+    )
+
+    assert cached.read_bytes() == b"payload"
+    assert not elsewhere.exists()
+
+
+def test_move_or_copy_falls_back_to_copy_across_devices(
+    tmp_path: Path, monkeypatch
+) -> None:
+    source = tmp_path / "source.bin"
+    target = tmp_path / "target.bin"
+    source.write_bytes(b"payload")
+    target.write_bytes(b"stale")
+
+    def cross_device(_src, _dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(cache_storage.os, "replace", cross_device)
+    cache_storage.move_or_copy(source, target)
+
+    assert target.read_bytes() == b"payload"
+    assert not source.exists()
+
+
 def test_unified_probe_bundle_reuses_one_media_info_probe(tmp_path: Path, monkeypatch) -> None:
     media = tmp_path / "clip.mp4"
     media.write_bytes(b"not-real-media")
@@ -163,6 +267,57 @@ def test_unified_probe_bundle_reuses_one_media_info_probe(tmp_path: Path, monkey
     assert payload["duration"] == 1.25
 
 
+def test_probe_bundle_memo_skips_json_reread_until_media_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"memo-test")
+    manager = CacheManager(tmp_path / "cache")
+    calls = 0
+
+    async def fake_info(_path: str, caller=None):
+        nonlocal calls
+        calls += 1
+        return {"duration": float(calls), "video": {}, "audio": {}}
+
+    monkeypatch.setattr(cache_module, "get_media_info", fake_info)
+    assert asyncio.run(manager.get_or_create_media_duration(media)) == 1.0
+
+    reads = 0
+    original_read = manager._read_probe_bundle
+
+    def counting_read(path: Path):
+        nonlocal reads
+        reads += 1
+        return original_read(path)
+
+    monkeypatch.setattr(manager, "_read_probe_bundle", counting_read)
+    assert asyncio.run(manager.get_or_create_media_info(media))["duration"] == 1.0
+    assert reads == 0
+    assert calls == 1
+
+    media.write_bytes(b"memo-test-changed")
+    assert asyncio.run(manager.get_or_create_media_duration(media)) == 2.0
+    assert calls == 2
+
+
+def test_media_info_callers_cannot_mutate_the_probe_memo(tmp_path: Path, monkeypatch) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"memo-copy")
+    manager = CacheManager(tmp_path / "cache")
+
+    async def fake_info(_path: str, caller=None):
+        return {"duration": 1.0, "video": {"width": 320}, "audio": None}
+
+    monkeypatch.setattr(cache_module, "get_media_info", fake_info)
+    first = asyncio.run(manager.get_or_create_media_info(media))
+    first["duration"] = 99.0
+    first["video"]["width"] = 1
+
+    second = asyncio.run(manager.get_or_create_media_info(media))
+    assert second == {"duration": 1.0, "video": {"width": 320}, "audio": None}
+
+
 def test_duration_only_public_monkeypatch_contract_is_preserved(tmp_path: Path, monkeypatch) -> None:
     media = tmp_path / "clip.mp4"
     media.write_bytes(b"not-real-media")
@@ -247,6 +402,125 @@ def test_ttl_cleanup_physically_deletes_expired_file_and_manifest(tmp_path: Path
     assert "ttl_expired" in reasons
 
 
+def test_size_eviction_counts_companion_and_keeps_newer_entries(tmp_path: Path) -> None:
+    manager = CacheManager(tmp_path / "cache", max_size_mb=3 / 1024)
+    video = manager.cache_dir / "temp_normalized_deadbeef.mp4"
+    manifest = manager.cache_dir / "temp_normalized_deadbeef.meta.json"
+    newer = manager.cache_dir / "scene_newer.mp4"
+    video.write_bytes(b"v" * 1024)
+    manifest.write_bytes(b"m" * 1024)
+    newer.write_bytes(b"n" * 2048)
+    os.utime(video, (1_600_000_000, 1_600_000_000))
+    os.utime(manifest, (1_600_000_001, 1_600_000_001))
+
+    manager._clean_cache()
+
+    assert not video.exists()
+    assert not manifest.exists()
+    assert newer.exists()
+
+
+def test_no_cache_init_leaves_persistent_cache_untouched(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    stale = cache_dir / "scene_old.mp4"
+    stale.write_bytes(b"x")
+    os.utime(stale, (1_600_000_000, 1_600_000_000))
+
+    CacheManager(cache_dir, no_cache=True, ttl_hours=1)
+    assert stale.exists()
+
+    CacheManager(cache_dir, ttl_hours=1)
+    assert not stale.exists()
+
+
+def test_no_cache_init_does_not_scan_the_cache_dir(tmp_path: Path, monkeypatch) -> None:
+    scans: list[Path] = []
+    monkeypatch.setattr(
+        CacheManager, "_clean_cache", lambda self: scans.append(self.cache_dir)
+    )
+
+    CacheManager(tmp_path / "disabled", no_cache=True, max_size_mb=1, ttl_hours=1)
+    assert scans == []
+
+    CacheManager(tmp_path / "enabled", max_size_mb=1, ttl_hours=1)
+    assert scans == [tmp_path / "enabled"]
+
+
+def test_cache_writes_defer_cleanup_until_flush(tmp_path: Path, monkeypatch) -> None:
+    manager = CacheManager(tmp_path / "cache", max_size_mb=1)
+    cleanups: list[int] = []
+    monkeypatch.setattr(manager, "_clean_cache", lambda: cleanups.append(1))
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"payload")
+
+    for index in range(3):
+        manager.cache_file(source, {"value": index}, "sample", "bin")
+    assert cleanups == []
+
+    manager.flush_cache_cleanup()
+    manager.flush_cache_cleanup()
+    assert cleanups == [1]
+
+
+def test_async_get_or_create_scans_off_loop_and_deletes_on_loop(
+    tmp_path: Path, monkeypatch
+) -> None:
+    manager = CacheManager(tmp_path / "cache", max_size_mb=1)
+    manager._last_cleanup_at = 0.0
+    scan_threads: list[int] = []
+    apply_threads: list[int] = []
+    real_scan = manager._scan_cache_files
+
+    def tracking_scan():
+        scan_threads.append(threading.get_ident())
+        return real_scan()
+
+    monkeypatch.setattr(manager, "_scan_cache_files", tracking_scan)
+    monkeypatch.setattr(
+        manager,
+        "_apply_cache_cleanup",
+        lambda _files: apply_threads.append(threading.get_ident()),
+    )
+
+    async def creator(output_path: Path) -> Path:
+        output_path.write_bytes(b"payload")
+        return output_path
+
+    async def _run() -> int:
+        await manager.get_or_create(
+            key_data={"value": 1},
+            file_name="sample",
+            extension="bin",
+            creator_func=creator,
+        )
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(_run())
+    assert len(scan_threads) == 1
+    assert scan_threads[0] != loop_thread
+    assert apply_threads == [loop_thread]
+
+
+def test_size_eviction_prefers_old_large_entry_over_many_small_ones(tmp_path: Path) -> None:
+    manager = CacheManager(tmp_path / "cache", max_size_mb=8 / 1024)
+    now = 1_700_000_000
+    large = manager.cache_dir / "scene_large.mp4"
+    large.write_bytes(b"l" * 6144)
+    os.utime(large, (now - 3600, now - 3600))
+    small = []
+    for index in range(4):
+        path = manager.cache_dir / f"voice_small_{index}.wav"
+        path.write_bytes(b"s" * 1024)
+        os.utime(path, (now - 7200, now - 7200))
+        small.append(path)
+
+    manager._clean_cache()
+
+    assert not large.exists()
+    assert all(path.exists() for path in small)
+
+
 def test_size_eviction_and_manual_invalidation_report_reasons(tmp_path: Path, monkeypatch) -> None:
     manager = CacheManager(tmp_path / "cache", max_size_mb=0.000001)
     reasons: list[str] = []
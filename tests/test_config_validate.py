@@ -23,6 +23,26 @@ def test_validate_module_preserves_existing_private_imports():
     assert callable(validate_module._is_valid_color_string)
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("#fff", True),
+        ("#12345678", True),
+        ("#12", False),
+        ("rgba(0, 0, 0, 0.5)", True),
+        ("HSL(120, 50%, 50%)", True),
+        ("0xFF00FF", True),
+        ("0Xzz", False),
+        ("white", True),
+        ("red", True),
+        ("", False),
+        ("12", False),
+    ],
+)
+def test_is_valid_color_string_accepts_supported_forms(value: str, expected: bool):
+    assert validate_module._is_valid_color_string(value) is expected
+
+
 def test_validate_config_checks_background_fit():
     config = {"video": {"background_fit": "invalid"}, "script": {"scenes": []}}
 
@@ -95,6 +115,29 @@ def test_validate_config_accepts_existing_assets(tmp_path: Path):
     validate_config(config)
 
 
+def test_validate_config_checks_top_level_assets_once(tmp_path: Path, monkeypatch):
+    from zundamotion.components.config import validate_script
+
+    asset = tmp_path / "asset.png"
+    asset.write_bytes(b"placeholder")
+    config = {
+        "assets": {"logo": str(asset)},
+        "script": {"scenes": [{"id": f"scene{i}", "lines": []} for i in range(3)]},
+    }
+    checked = []
+    real_path_kind = validate_script.path_kind
+
+    def tracking_path_kind(path):
+        checked.append(path)
+        return real_path_kind(path)
+
+    monkeypatch.setattr(validate_script, "path_kind", tracking_path_kind)
+
+    validate_config(config)
+
+    assert checked == [str(asset)]
+
+
 def test_validate_config_preserves_wait_error_message():
     config = _config_with_line({"wait": {"duration": 0}})
 
@@ -113,6 +156,30 @@ def test_validate_config_preserves_sound_effect_type_error(tmp_path: Path):
         validate_config(config)
 
 
+def test_validate_config_stats_reused_file_once(tmp_path: Path, monkeypatch):
+    from zundamotion.components.config import validate_common
+
+    sound_effect = tmp_path / "effect.wav"
+    sound_effect.write_bytes(b"placeholder")
+    line = {"text": "hello", "sound_effects": [{"path": str(sound_effect)}]}
+    config = {"script": {"scenes": [{"id": "scene", "lines": [dict(line) for _ in range(5)]}]}}
+    stat_calls = []
+    real_stat = validate_common.os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        stat_calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(validate_common.os, "stat", counting_stat)
+
+    validate_config(config)
+    sound_effect.unlink()
+
+    assert stat_calls == [str(sound_effect)]
+    with pytest.raises(ValidationError, match="does not exist"):
+        validate_config(config)
+
+
 @pytest.mark.parametrize(
     ("color_filter", "message"),
     [
@@ -272,3 +339,78 @@ def test_validate_config_rejects_non_aac_final_mp4_audio() -> None:
                 "script": {"scenes": []},
             }
         )
+
+
+def test_validation_choice_sets_are_frozen_and_used_for_membership():
+    from zundamotion.components.config import validate_common
+
+    for choices in (
+        validate_common.BACKGROUND_FIT_CHOICES,
+        validate_common.ANCHOR_CHOICES,
+        validate_common.IMAGE_LAYER_TRANSITION_TYPES,
+        validate_common.BADGE_POSITION_CHOICES,
+    ):
+        assert isinstance(choices, frozenset)
+    assert "cover" in validate_common.BACKGROUND_FIT_CHOICES
+    assert "top-right" in validate_common.BADGE_POSITION_CHOICES
+    validate_config({"video": {"background_fit": "cover"}, "script": {"scenes": []}})
+
+
+def test_validate_config_skips_character_color_filter_and_move_when_none(monkeypatch):
+    from zundamotion.components.config import validate_script
+
+    calls = []
+    monkeypatch.setattr(
+        validate_script,
+        "validate_character_color_filter",
+        lambda value, label: calls.append(label),
+    )
+    monkeypatch.setattr(
+        validate_script,
+        "_validate_character_move",
+        lambda value, label: calls.append(label),
+    )
+
+    validate_config(
+        _config_with_line(
+            {
+                "text": "hello",
+                "characters": [
+                    {"name": "hero", "color_filter": None, "move": None},
+                    {"name": "sidekick"},
+                ],
+            }
+        )
+    )
+
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("character", "message"),
+    [
+        ({"name": "hero", "color_filter": "red"}, "color_filter.*must be a dictionary"),
+        ({"name": "hero", "move": "left"}, "move must be a dictionary"),
+        ({"name": "hero", "move": {"enabled": "yes"}}, "move.enabled must be a boolean"),
+    ],
+)
+def test_validate_config_rejects_invalid_character_color_filter_or_move(
+    character: dict, message: str
+):
+    with pytest.raises(ValidationError, match=message):
+        validate_config(_config_with_line({"text": "hello", "characters": [character]}))
+
+
+def test_overlay_validation_does_not_mutate_shared_empty_default(tmp_path: Path):
+    from zundamotion.components.config import validate_overlays
+
+    overlay = tmp_path / "overlay.png"
+    overlay.write_bytes(b"placeholder")
+    config = _config_with_line(
+        {"text": "hello", "fg_overlays": [{"src": str(overlay), "mode": "overlay"}]}
+    )
+
+    validate_config(config)
+    validate_config(config)
+
+    assert validate_overlays._EMPTY_DICT == {}
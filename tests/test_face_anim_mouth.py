@@ -0,0 +1,56 @@
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from zundamotion.utils.face_anim import _wav_to_mono_samples, compute_mouth_timeline
+
+
+def _write_wav(path: Path, frames: list[tuple[int, ...]], sampwidth: int, rate: int = 100) -> None:
+    fmt = {1: "B", 2: "<h", 3: None, 4: "<i"}[sampwidth]
+    payload = bytearray()
+    for frame in frames:
+        for value in frame:
+            if fmt is None:
+                payload += int(value).to_bytes(3, "little", signed=True)
+            else:
+                payload += struct.pack(fmt, value)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(len(frames[0]))
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(rate)
+        wf.writeframes(bytes(payload))
+
+
+@pytest.mark.parametrize(
+    ("sampwidth", "frames", "expected"),
+    [
+        (1, [(128,), (192,), (64,)], [0.0, 0.5, -0.5]),
+        (2, [(16384, -16384), (32767, 32767)], [0.0, 32767 / 32768]),
+        (3, [(1 << 22,), (-(1 << 22),)], [0.5, -0.5]),
+        (4, [(1 << 30, 1 << 30)], [0.5]),
+    ],
+)
+def test_wav_to_mono_samples_normalizes_and_averages_channels(
+    tmp_path: Path, sampwidth: int, frames, expected
+) -> None:
+    path = tmp_path / "in.wav"
+    _write_wav(path, frames, sampwidth)
+
+    samples, rate = _wav_to_mono_samples(path)
+
+    assert rate == 100
+    assert samples == pytest.approx(expected)
+
+
+def test_compute_mouth_timeline_thresholds_rms_windows(tmp_path: Path) -> None:
+    path = tmp_path / "speech.wav"
+    # 10 fps windows of 10 samples: loud, quiet, silent
+    frames = [(30000,), (-30000,)] * 5 + [(9000,), (-9000,)] * 5 + [(0,)] * 10
+    _write_wav(path, frames, 2)
+
+    segments = compute_mouth_timeline(path, fps=10, thr_half_ratio=0.2, thr_open_ratio=0.5)
+
+    assert [segment["state"] for segment in segments] == ["open", "half", "close"]
+    assert segments[-1]["end"] == pytest.approx(0.3)
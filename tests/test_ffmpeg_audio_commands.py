@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 from zundamotion.utils.ffmpeg_audio import create_silent_audio, mix_audio_tracks
 from zundamotion.utils.ffmpeg_params import AudioParams
 
@@ -30,3 +33,47 @@ def test_silent_and_mix_commands_encode_pcm_wav(monkeypatch, tmp_path):
     for command in commands:
         assert command[command.index("-c:a") + 1] == "pcm_s16le"
         assert "-b:a" not in command
+
+
+@pytest.mark.parametrize(
+    ("version", "option"),
+    [
+        ("7.0.2", "-filter_complex_script"),
+        ("7.1", "-/filter_complex"),
+        ("N-118000-g0123456789", "-/filter_complex"),
+        (None, "-filter_complex_script"),
+    ],
+)
+def test_mix_with_many_tracks_passes_filter_graph_as_file(
+    monkeypatch, tmp_path, version, option
+):
+    seen = {}
+
+    async def fake_run(command, **_kwargs):
+        script = command[command.index(option) + 1]
+        seen["command"] = command
+        seen["script"] = script
+        seen["graph"] = open(script, encoding="utf-8").read()
+        return SimpleNamespace(stdout="", stderr="")
+
+    async def fake_version(_ffmpeg_path="ffmpeg"):
+        return version
+
+    monkeypatch.setitem(mix_audio_tracks.__globals__, "_run_ffmpeg_async", fake_run)
+    monkeypatch.setitem(mix_audio_tracks.__globals__, "get_ffmpeg_version", fake_version)
+    monkeypatch.setitem(mix_audio_tracks.__globals__, "_FILTER_FILE_OPTION_CACHE", {})
+    tracks = [(f"se{i}.wav", i * 0.1, 1.0) for i in range(9)]
+
+    asyncio.run(
+        mix_audio_tracks(
+            tracks,
+            str(tmp_path / "mixed.wav"),
+            total_duration=1.0,
+            audio_params=AudioParams(),
+        )
+    )
+
+    assert "-filter_complex" not in seen["command"]
+    assert "amix=inputs=9" in seen["graph"]
+    assert Path(seen["script"]).parent != tmp_path
+    assert not Path(seen["script"]).exists()
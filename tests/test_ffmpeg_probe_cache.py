@@ -1,5 +1,6 @@
 import asyncio
 import json
+import wave
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -104,3 +105,88 @@ def test_media_duration_deduplicates_parallel_probe(
         assert calls == 1
 
     asyncio.run(_run())
+
+
+def test_media_duration_falls_back_to_stream_duration_without_second_probe(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    media = tmp_path / "clip.webm"
+    media.write_bytes(b"fake-media")
+    commands = []
+
+    async def fake_run_ffmpeg_async(cmd, context=None):
+        commands.append(cmd)
+        return SimpleNamespace(
+            stdout=json.dumps(
+                {
+                    "format": {"duration": "N/A"},
+                    "streams": [
+                        {"codec_type": "video", "duration": "3.50"},
+                        {"codec_type": "audio", "duration": "3.52"},
+                    ],
+                }
+            ),
+            stderr="",
+        )
+
+    ffmpeg_probe.clear_probe_caches()
+    monkeypatch.setitem(
+        ffmpeg_probe.get_media_duration.__globals__,
+        "run_ffmpeg_async",
+        fake_run_ffmpeg_async,
+    )
+
+    duration = asyncio.run(ffmpeg_probe.get_media_duration(str(media)))
+
+    assert duration == 3.52
+    assert len(commands) == 1
+
+
+def test_get_audio_duration_reads_pcm_wav_header_without_ffprobe(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    bgm = tmp_path / "bgm.wav"
+    with wave.open(str(bgm), "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(8000)
+        writer.writeframes(b"\x00\x00\x00\x00" * 12000)
+
+    async def fail_run_ffmpeg_async(cmd, context=None):
+        raise AssertionError("ffprobe should not run for a PCM WAV")
+
+    monkeypatch.setattr(ffmpeg_probe, "run_ffmpeg_async", fail_run_ffmpeg_async)
+
+    assert asyncio.run(ffmpeg_probe.get_audio_duration(str(bgm))) == 1.5
+
+
+def test_get_audio_duration_wav_header_matches_ffprobe_rounding(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    speech = tmp_path / "speech.wav"
+    with wave.open(str(speech), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(8000)
+        writer.writeframes(b"\x00\x00" * 9876)
+
+    async def fake_run_ffmpeg_async(cmd, context=None):
+        return SimpleNamespace(
+            stdout=json.dumps({"format": {"duration": "1.234500"}}),
+            stderr="",
+        )
+
+    ffmpeg_probe.clear_probe_caches()
+    monkeypatch.setattr(ffmpeg_probe, "run_ffmpeg_async", fake_run_ffmpeg_async)
+    from_header = asyncio.run(ffmpeg_probe.get_audio_duration(str(speech)))
+
+    def fail_read_wav_duration(_path):
+        raise ValueError("force ffprobe")
+
+    monkeypatch.setattr(ffmpeg_probe, "read_wav_duration", fail_read_wav_duration)
+    from_ffprobe = asyncio.run(ffmpeg_probe.get_audio_duration(str(speech)))
+
+    assert from_header == from_ffprobe == 1.23
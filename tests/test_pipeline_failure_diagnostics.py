@@ -87,3 +87,29 @@ def test_failure_summary_contains_partial_perf_and_history(tmp_path: Path) -> No
     history = tmp_path / f"perf-summary.{perf.run_id}.json"
     assert history.is_file()
     assert json.loads(history.read_text(encoding="utf-8")) == payload
+
+
+def test_failed_run_still_flushes_deferred_cache_cleanup(tmp_path: Path, monkeypatch) -> None:
+    from zundamotion import pipeline as pipeline_module
+
+    class FailingAudioPhase:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        async def run(self, *_args, **_kwargs):
+            raise RuntimeError("audio exploded")
+
+    monkeypatch.setenv("USE_RAMDISK", "0")
+    monkeypatch.setattr(pipeline_module, "AudioPhase", FailingAudioPhase)
+    pipeline = pipeline_module.GenerationPipeline(
+        {"system": {"cache_dir": str(tmp_path / "cache")}, "script": {"scenes": []}}
+    )
+    flushed = []
+    monkeypatch.setattr(
+        pipeline.cache_manager, "flush_cache_cleanup", lambda: flushed.append(True)
+    )
+
+    with pytest.raises(RuntimeError, match="audio exploded"):
+        asyncio.run(pipeline.run(str(tmp_path / "out.mp4")))
+
+    assert flushed == [True]
@@ -113,6 +113,14 @@ def test_vars_undefined_raises(tmp_path):
         resolve_script(entry)
 
 
+def test_invalid_yaml_raises_validation_error(tmp_path):
+    entry = tmp_path / "entry.yaml"
+    entry.write_text("scenes: [\n  - id: broken\n", encoding="utf-8")
+
+    with pytest.raises(ValidationError, match="Invalid YAML syntax"):
+        resolve_script(entry)
+
+
 def test_include_cycle_detection(tmp_path):
     a = tmp_path / "a.yaml"
     b = tmp_path / "b.yaml"
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from zundamotion.components.audio import voicevox_client
+
+
+def test_voicevox_client_is_reused_per_session_and_url_until_closed():
+    async def _run():
+        async with voicevox_client.voicevox_session():
+            first = voicevox_client._get_client("http://voicevox:50021")
+            other = voicevox_client._get_client("http://other:50021")
+            async with voicevox_client.voicevox_session():
+                again = voicevox_client._get_client("http://voicevox:50021")
+            assert first is again
+            assert first is not other
+            assert not first.is_closed
+        assert first.is_closed and other.is_closed
+
+        async with voicevox_client.voicevox_session():
+            assert voicevox_client._get_client("http://voicevox:50021") is not first
+
+        with pytest.raises(RuntimeError):
+            voicevox_client._get_client("http://voicevox:50021")
+
+    asyncio.run(_run())
+
+
+def test_direct_calls_close_their_client(monkeypatch):
+    created = []
+    real_async_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[{"name": "ずんだもん", "styles": [{"id": 3, "name": "ノーマル"}]}],
+        )
+
+    def fake_async_client(**kwargs):
+        client = real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(voicevox_client.httpx, "AsyncClient", fake_async_client)
+
+    async def _run():
+        return await asyncio.gather(
+            voicevox_client.get_speakers_info("http://voicevox:50021"),
+            voicevox_client.get_speakers_info("http://voicevox:50021"),
+        )
+
+    results = asyncio.run(_run())
+
+    assert results[0][3]["speaker_name"] == "ずんだもん"
+    assert len(created) == 2
+    assert all(client.is_closed for client in created)
+
+
+def test_generate_voice_streams_synthesis_to_file(monkeypatch, tmp_path):
+    payload = b"RIFF" + bytes(range(256)) * 1024
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/synthesis":
+            body = json.loads(request.content)
+            assert body["speedScale"] == 1.1
+            return httpx.Response(200, content=payload)
+        return httpx.Response(404)
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(voicevox_client, "_get_client", lambda _url: client)
+        try:
+            await voicevox_client.generate_voice(
+                text="こんにちは",
+                speaker=3,
+                filepath=str(tmp_path / "out.wav"),
+                speed=1.1,
+                voicevox_url="http://voicevox:50021",
+                audio_query={"accent_phrases": []},
+            )
+        finally:
+            await client.aclose()
+
+    asyncio.run(_run())
+
+    assert requests == ["/synthesis"]
+    assert (tmp_path / "out.wav").read_bytes() == payload
+
+
+def test_generate_voice_discards_partial_synthesis_body(monkeypatch, tmp_path):
+    class _BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b"RIFF" + b"\0" * 64
+            raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_BrokenStream())
+
+    target = tmp_path / "out.wav"
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(voicevox_client, "_get_client", lambda _url: client)
+        try:
+            await voicevox_client.generate_voice(
+                text="こんにちは",
+                speaker=3,
+                filepath=str(target),
+                voicevox_url="http://voicevox:50021",
+                retry_attempts=2,
+                retry_wait_min=0.0,
+                retry_wait_max=0.0,
+                audio_query={"accent_phrases": []},
+            )
+        finally:
+            await client.aclose()
+
+    with pytest.raises(httpx.ReadError):
+        asyncio.run(_run())
+
+    assert list(tmp_path.iterdir()) == []
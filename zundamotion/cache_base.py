@@ -2,7 +2,6 @@
 
 import asyncio
 import hashlib
-import inspect
 import json
 import os
 import re
@@ -10,11 +9,12 @@ import shutil
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
 
+from .cache_storage import move_or_copy
 from .exceptions import CacheError
 from .utils.ffmpeg_params import AudioParams, VideoParams
-from .utils.ffmpeg_probe import (MediaInfo, get_media_info, get_media_duration, probe_media_params_async)
+from .utils.ffmpeg_probe import probe_media_params_async
 from .utils.ffmpeg_ops import normalize_media
 
 from .utils.logger import logger
@@ -57,8 +57,29 @@ _CACHE_KEY_PATH_FIELDS = {
 }
 
 
+# 書き込み後クリーンアップの間引き条件（件数・秒）。
+_CLEANUP_MAX_PENDING_WRITES = 128
+_CLEANUP_MIN_INTERVAL_SEC = 60.0
+
+
+class _PathEncoder(json.JSONEncoder):
+    """cache key 用に ``Path`` を文字列として直列化する。"""
+
+    def default(self, obj):
+        if isinstance(obj, Path):
+            return str(obj)
+        return json.JSONEncoder.default(self, obj)
+
+
+# encode() は呼び出しごとに状態を持たないため、ハッシュ計算で 1 つを使い回す
+_CACHE_KEY_ENCODER = _PathEncoder(sort_keys=True)
+
+
 class CacheManager:
-    """メディア情報や正規化ファイルをキャッシュする。"""
+    """メディア情報や正規化ファイルをキャッシュする。
+
+    単体でも動く既定実装を持ち、cache_runtime / cache_lifecycle が一部を上書きする。
+    """
 
     def __init__(
         self,
@@ -73,6 +94,9 @@ class CacheManager:
         self.cache_refresh = cache_refresh
         self.max_size_mb = max_size_mb
         self.ttl_hours = ttl_hours
+        # 書き込みごとの全走査を避けるため、クリーンアップは間引いて実行する。
+        self._pending_cleanup_writes = 0
+        self._last_cleanup_at = time.monotonic()
         # Ephemeral (temporary) directory to use when no_cache=True
         self.ephemeral_dir: Optional[Path] = None
         # In-process de-duplication for no-cache creation
@@ -81,11 +105,17 @@ class CacheManager:
         # When cache_refresh=True, invalidate each key at most once per process.
         self._refresh_lock = asyncio.Lock()
         self._refreshed_keys: set[str] = set()
+        # 正規化済み入力の隣接 meta.json を (mtime_ns, size) 付きで保持する。
+        self._sidecar_meta_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        # cache key 生成で繰り返し解決するパスの realpath を実行中だけ保持する。
+        self._realpath_cache: Dict[str, str] = {}
 
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Cache directory initialized: {self.cache_dir.resolve()}")
-            self._clean_cache()  # キャッシュ初期化時にクリーンアップを実行
+            if not self.no_cache:
+                # --no-cache では永続キャッシュに触れないため、初期化時の走査も行わない
+                self._clean_cache()  # キャッシュ初期化時にクリーンアップを実行
         except Exception as e:
             raise CacheError(f"Failed to initialize cache directory: {e}")
 
@@ -158,13 +188,22 @@ class CacheManager:
 
         for candidate in candidates:
             try:
-                resolved = candidate.expanduser().resolve()
+                resolved = Path(self._realpath_cached(candidate))
             except Exception:
                 continue
             if resolved.is_file():
                 return resolved
         return None
 
+    def _realpath_cached(self, path: str | Path) -> str:
+        """symlink 解決の syscall を同一実行内で 1 パスにつき 1 回へ抑える。"""
+        key = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        resolved = self._realpath_cache.get(key)
+        if resolved is None:
+            resolved = os.path.realpath(key)
+            self._realpath_cache[key] = resolved
+        return resolved
+
     def _cache_key_file_signature(self, file_path: Path) -> Dict[str, Any]:
         """Return file identity for cache keys so same-path asset replacements miss."""
         stat = file_path.stat()
@@ -234,20 +273,11 @@ class CacheManager:
 
     def _generate_hash(self, data: Dict[str, Any]) -> str:
         """辞書データから SHA256 ハッシュを生成する。"""
-
-        class PathEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, Path):
-                    return str(obj)
-                return json.JSONEncoder.default(self, obj)
-
         key_data = {
             "__cache_key_version": "20260510_media_content_signature_v1",
             "data": self._augment_file_signatures_for_hash(data),
         }
-        sorted_data = json.dumps(key_data, sort_keys=True, cls=PathEncoder).encode(
-            "utf-8"
-        )
+        sorted_data = _CACHE_KEY_ENCODER.encode(key_data).encode("utf-8")
         return hashlib.sha256(sorted_data).hexdigest()
 
     def _media_probe_cache_key_data(self, file_path: Path, operation: str) -> Dict[str, Any]:
@@ -270,184 +300,6 @@ class CacheManager:
         base_dir = self.ephemeral_dir if self.no_cache and self.ephemeral_dir else self.cache_dir
         return base_dir / f"{prefix}_{cache_key}.json"
 
-    @staticmethod
-    def _infer_probe_caller() -> str:
-        for frame in inspect.stack()[2:]:
-            module = inspect.getmodule(frame.frame)
-            module_name = getattr(module, "__name__", "")
-            if module_name.endswith(".cache") or module_name.endswith(".ffmpeg_probe"):
-                continue
-            return str(frame.function)
-        return "unknown"
-
-    async def get_or_create_media_info(self, file_path: Path, caller: Optional[str] = None) -> MediaInfo:
-        """メディアのメタ情報を取得しキャッシュする。"""
-        resolved_caller = str(caller or self._infer_probe_caller())
-        key_data = self._media_probe_cache_key_data(file_path, "media_info")
-        cache_key = self._generate_hash(key_data)
-        cached_meta_path = self._probe_meta_path("info", cache_key)
-
-        await self._refresh_cached_path_once(
-            f"media_info:{cache_key}",
-            cached_meta_path,
-            log_label="duration cache",
-        )
-
-        if cached_meta_path.exists():
-            try:
-                with open(cached_meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                info = meta["media_info"]
-                logger.info(
-                    f"Cache HIT for media info of {file_path.name} (key: {cache_key[:8]})"
-                )
-                perf_stats.incr("cache_hit")
-                perf = perf_stats.current_perf_stats()
-                if perf is not None:
-                    perf.record_ffprobe_call(
-                        kind="stream",
-                        caller=resolved_caller,
-                        path=str(file_path),
-                        elapsed_ms=0.0,
-                        cache_hit=True,
-                    )
-                return info
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(
-                    f"Corrupted media info cache for {file_path.name}: {e}. Regenerating."
-                )
-                cached_meta_path.unlink(missing_ok=True)
-
-        logger.info(
-            f"Cache MISS for media info of {file_path.name} (key: {cache_key[:8]}). Generating..."
-        )
-        task_key = f"media_info:{cache_key}"
-        async with self._inflight_lock:
-            existing = self._inflight_tasks.get(task_key)
-            if existing is None:
-                perf_stats.incr("cache_miss")
-
-                async def _create_media_info() -> MediaInfo:
-                    try:
-                        if cached_meta_path.exists():
-                            with open(cached_meta_path, "r", encoding="utf-8") as f:
-                                meta = json.load(f)
-                            perf_stats.incr("cache_hit")
-                            perf = perf_stats.current_perf_stats()
-                            if perf is not None:
-                                perf.record_ffprobe_call(
-                                    kind="stream",
-                                    caller=resolved_caller,
-                                    path=str(file_path),
-                                    elapsed_ms=0.0,
-                                    cache_hit=True,
-                                )
-                            return meta["media_info"]
-                        info = await get_media_info(str(file_path), caller=resolved_caller)
-                        with open(cached_meta_path, "w", encoding="utf-8") as f:
-                            json.dump({"media_info": info, "created_at": time.time()}, f)
-                        perf_stats.incr("cache_write")
-                        logger.debug(f"Cached media info for {file_path.name}")
-                        if not self.no_cache:
-                            self._clean_cache()
-                        return info
-                    except Exception as e:
-                        raise CacheError(
-                            f"Failed to get or cache media info for {file_path.name}: {e}"
-                        )
-                    finally:
-                        async with self._inflight_lock:
-                            self._inflight_tasks.pop(task_key, None)
-
-                task = asyncio.create_task(_create_media_info())
-                self._inflight_tasks[task_key] = task
-            else:
-                task = existing
-        return await task
-    async def get_or_create_media_duration(self, file_path: Path, caller: Optional[str] = None) -> float:
-        """メディアの再生時間を取得しキャッシュする。"""
-        resolved_caller = str(caller or self._infer_probe_caller())
-        key_data = self._media_probe_cache_key_data(file_path, "media_duration")
-        cache_key = self._generate_hash(key_data)
-        cached_meta_path = self._probe_meta_path("duration", cache_key)
-
-        await self._refresh_cached_path_once(
-            f"media_duration:{cache_key}",
-            cached_meta_path,
-            log_label="duration cache",
-        )
-
-        if cached_meta_path.exists():
-            try:
-                with open(cached_meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                duration = meta["duration"]
-                logger.info(
-                    f"Cache HIT for duration of {file_path.name} (key: {cache_key[:8]}) -> {duration:.2f}s"
-                )
-                perf_stats.incr("cache_hit")
-                perf = perf_stats.current_perf_stats()
-                if perf is not None:
-                    perf.record_ffprobe_call(
-                        kind="duration",
-                        caller=resolved_caller,
-                        path=str(file_path),
-                        elapsed_ms=0.0,
-                        cache_hit=True,
-                    )
-                return duration
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(
-                    f"Corrupted duration cache for {file_path.name}: {e}. Regenerating."
-                )
-                cached_meta_path.unlink(missing_ok=True)
-
-        logger.info(
-            f"Cache MISS for duration of {file_path.name} (key: {cache_key[:8]}). Generating..."
-        )
-        task_key = f"media_duration:{cache_key}"
-        async with self._inflight_lock:
-            existing = self._inflight_tasks.get(task_key)
-            if existing is None:
-                perf_stats.incr("cache_miss")
-
-                async def _create_duration() -> float:
-                    try:
-                        if cached_meta_path.exists():
-                            with open(cached_meta_path, "r", encoding="utf-8") as f:
-                                meta = json.load(f)
-                            perf_stats.incr("cache_hit")
-                            perf = perf_stats.current_perf_stats()
-                            if perf is not None:
-                                perf.record_ffprobe_call(
-                                    kind="duration",
-                                    caller=resolved_caller,
-                                    path=str(file_path),
-                                    elapsed_ms=0.0,
-                                    cache_hit=True,
-                                )
-                            return float(meta["duration"])
-                        duration = await get_media_duration(str(file_path), caller=resolved_caller)
-                        with open(cached_meta_path, "w", encoding="utf-8") as f:
-                            json.dump({"duration": duration, "created_at": time.time()}, f)
-                        perf_stats.incr("cache_write")
-                        logger.debug(f"Cached duration for {file_path.name} -> {duration:.2f}s")
-                        if not self.no_cache:
-                            self._clean_cache()
-                        return duration
-                    except Exception as e:
-                        raise CacheError(
-                            f"Failed to get or cache media duration for {file_path.name}: {e}"
-                        )
-                    finally:
-                        async with self._inflight_lock:
-                            self._inflight_tasks.pop(task_key, None)
-
-                task = asyncio.create_task(_create_duration())
-                self._inflight_tasks[task_key] = task
-            else:
-                task = existing
-        return await task
     def _remove_expired_files(self, files):
         """有効期限切れのキャッシュを削除し、残りのファイル情報を返す。"""
         if self.ttl_hours is None:
@@ -490,22 +342,67 @@ class CacheManager:
                 f"to stay within max size limit ({self.max_size_mb} MB)."
             )
 
+    def _cleanup_due(self) -> bool:
+        """書き込みを 1 件数え、クリーンアップ実行時期なら保留カウンタを戻して True を返す。"""
+        if self.max_size_mb is None and self.ttl_hours is None:
+            return False
+        self._pending_cleanup_writes += 1
+        if (
+            self._pending_cleanup_writes < _CLEANUP_MAX_PENDING_WRITES
+            and time.monotonic() - self._last_cleanup_at < _CLEANUP_MIN_INTERVAL_SEC
+        ):
+            return False
+        self._pending_cleanup_writes = 0
+        self._last_cleanup_at = time.monotonic()
+        return True
+
+    def _maybe_clean_cache(self) -> None:
+        """書き込み件数か経過時間が閾値を超えたときだけクリーンアップする。"""
+        if self._cleanup_due():
+            self._clean_cache()
+
+    async def _maybe_clean_cache_async(self) -> None:
+        """非同期経路用。ディレクトリ走査だけをスレッドで行い、削除と診断の記録はループ上で適用する。"""
+        if self._cleanup_due():
+            files = await asyncio.to_thread(self._scan_cache_files)
+            if files is not None:
+                self._apply_cache_cleanup(files)
+
+    def flush_cache_cleanup(self) -> None:
+        """間引きで保留した書き込みがあればクリーンアップを実行する。"""
+        if self._pending_cleanup_writes == 0:
+            return
+        self._pending_cleanup_writes = 0
+        self._last_cleanup_at = time.monotonic()
+        self._clean_cache()
+
     def _clean_cache(self):
         """キャッシュディレクトリをクリーンアップし不要ファイルを削除する。"""
+        files = self._scan_cache_files()
+        if files is not None:
+            self._apply_cache_cleanup(files)
+
+    def _scan_cache_files(self) -> Optional[list[Tuple[Path, int, float]]]:
+        """(path, size, atime) を集める。インスタンスの状態は変更しない。"""
         if not self.cache_dir.exists():
-            return
+            return None
         if self.max_size_mb is None and self.ttl_hours is None:
             logger.debug(
                 "Cache cleanup skipped: max_size_mb and ttl_hours are not set."
             )
-            return
+            return None
 
+        # scandir の DirEntry は種別を保持しているため、is_file 用の stat を省ける。
         files = []
-        for f in self.cache_dir.iterdir():
-            if f.is_file():
-                stat = f.stat()
-                files.append((f, stat.st_size, stat.st_atime))
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append((Path(entry.path), stat.st_size, stat.st_atime))
+        return files
 
+    def _apply_cache_cleanup(self, files: list[Tuple[Path, int, float]]) -> None:
+        """走査結果に TTL と容量上限を適用する。"""
         files = self._remove_expired_files(files)
         self._enforce_size_limit(files)
 
@@ -674,7 +571,7 @@ class CacheManager:
         shutil.copy(source_path, cached_path)
         perf_stats.incr("cache_write")
         logger.debug(f"Cached file -> {cached_path.name}")
-        self._clean_cache()  # ファイル追加後にクリーンアップを実行
+        self._maybe_clean_cache()  # ファイル追加後に必要ならクリーンアップを実行
         return cached_path
 
     def save_to_cache(
@@ -735,11 +632,7 @@ class CacheManager:
                         try:
                             generated_path = await creator_func(temp_output_path)
                             if generated_path != temp_output_path:
-                                shutil.copy(generated_path, temp_output_path)
-                                try:
-                                    generated_path.unlink()
-                                except Exception:
-                                    pass
+                                move_or_copy(generated_path, temp_output_path)
                             return temp_output_path
                         finally:
                             async with self._inflight_lock:
@@ -782,11 +675,10 @@ class CacheManager:
                         generated_path = await creator_func(cached_path)
                         if generated_path != cached_path:
                             # creator_func が別のパスに生成した場合、キャッシュパスにコピー
-                            shutil.copy(generated_path, cached_path)
-                            generated_path.unlink()  # 元の一時ファイルを削除
+                            move_or_copy(generated_path, cached_path)
                         logger.debug(f"Generated and cached file -> {cached_path.name}")
                         perf_stats.incr("cache_write")
-                        self._clean_cache()  # ファイル生成後にクリーンアップを実行
+                        await self._maybe_clean_cache_async()  # ファイル生成後に必要ならクリーンアップを実行
                         return cached_path
                     except Exception as e:
                         raise CacheError(
@@ -804,7 +696,7 @@ class CacheManager:
 
     def _hash_for_normalized(self, input_path: Path, target_spec: Dict) -> str:
         """正規化対象のハッシュキーを計算する。"""
-        p = input_path.resolve()
+        p = Path(self._realpath_cached(input_path))
         st = p.stat()
         signature = {
             "path": str(p),
@@ -815,6 +707,26 @@ class CacheManager:
         blob = json.dumps(signature, sort_keys=True, ensure_ascii=False).encode("utf-8")
         return hashlib.sha256(blob).hexdigest()
 
+    def _read_sidecar_meta(self, input_path: Path) -> Optional[Dict[str, Any]]:
+        """入力に隣接する meta.json を読み、同じ stat の間は解析結果を再利用する。"""
+        if not input_path.is_file():
+            return None
+        meta_path = input_path.with_name(input_path.stem + ".meta.json")
+        try:
+            st = meta_path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(meta_path)
+        cached = self._sidecar_meta_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta_obj = json.load(f)
+        if not isinstance(meta_obj, dict):
+            return None
+        self._sidecar_meta_cache[key] = (st.st_mtime_ns, st.st_size, meta_obj)
+        return meta_obj
+
     def _paths_for_hash(self, h: str) -> Dict[str, Path]:
         """ハッシュ値から出力・メタ・ロックファイルのパスを生成する。"""
         return {
@@ -848,24 +760,18 @@ class CacheManager:
         no_cache: bool = False,
     ) -> Path:
         # 既に正規化済みのMP4が入力に来た場合でも、隣接するメタの target_spec が一致すれば再正規化を避ける
-        try:
-            if input_path.is_file() and input_path.suffix.lower() == ".mp4":
-                meta_candidate = input_path.with_name(
-                    input_path.stem + ".meta.json"
+        if not force_refresh and input_path.suffix.lower() == ".mp4":
+            try:
+                meta_obj = await asyncio.to_thread(self._read_sidecar_meta, input_path)
+                if meta_obj is not None and meta_obj.get("target_spec") == target_spec:
+                    logger.info(
+                        f"[Cache] Normalized reuse: {input_path} (already matches target spec)"
+                    )
+                    return input_path
+            except Exception as e:
+                logger.debug(
+                    f"Skip pre-check for already-normalized input due to error: {e}"
                 )
-                if meta_candidate.exists():
-                    with open(meta_candidate, "r", encoding="utf-8") as f:
-                        meta_obj = json.load(f)
-                    cached_spec = meta_obj.get("target_spec")
-                    if cached_spec == target_spec and not force_refresh:
-                        logger.info(
-                            f"[Cache] Normalized reuse: {input_path} (already matches target spec)"
-                        )
-                        return input_path
-        except Exception as e:
-            logger.debug(
-                f"Skip pre-check for already-normalized input due to error: {e}"
-            )
 
         h = self._hash_for_normalized(input_path, target_spec)
         p = self._paths_for_hash(h)
@@ -972,34 +878,33 @@ class CacheManager:
         """入力メディアが target_spec を満たすか判定する。"""
         v_tgt = target_spec.get("video") or {}
         a_tgt = target_spec.get("audio") or {}
-
-        # “完全一致”の簡易判定（実用はもう少し緩くてもよい）
-        video_match = all(
-            [
-                (v_tgt.get("width") is None or v_tgt["width"] == current.get("width")),
-                (
-                    v_tgt.get("height") is None
-                    or v_tgt["height"] == current.get("height")
-                ),
-                (
-                    v_tgt.get("fps") is None
-                    or int(v_tgt["fps"]) == int(current.get("fps", 0))
-                ),
-                (
-                    v_tgt.get("pix_fmt") is None
-                    or v_tgt["pix_fmt"] == current.get("pix_fmt")
-                ),
-                (v_tgt.get("codec") is None or v_tgt["codec"] == current.get("vcodec")),
-            ]
-        )
-        audio_match = all(
-            [
-                (a_tgt.get("sr") is None or a_tgt["sr"] == current.get("asr")),
-                (a_tgt.get("ch") is None or a_tgt["ch"] == current.get("ach")),
-                (a_tgt.get("codec") is None or a_tgt["codec"] == current.get("acodec")),
-            ]
-        )
-
-        needs_encode = not (video_match and audio_match)
-        copy_ok = prefer_copy and (video_match and audio_match)
-        return needs_encode, copy_ok
+        mismatch = (True, False)
+
+        # “完全一致”の簡易判定（実用はもう少し緩くてもよい）。最初の不一致で返す。
+        width = v_tgt.get("width")
+        if width is not None and width != current.get("width"):
+            return mismatch
+        height = v_tgt.get("height")
+        if height is not None and height != current.get("height"):
+            return mismatch
+        fps = v_tgt.get("fps")
+        if fps is not None and int(fps) != int(current.get("fps", 0)):
+            return mismatch
+        pix_fmt = v_tgt.get("pix_fmt")
+        if pix_fmt is not None and pix_fmt != current.get("pix_fmt"):
+            return mismatch
+        vcodec = v_tgt.get("codec")
+        if vcodec is not None and vcodec != current.get("vcodec"):
+            return mismatch
+
+        sample_rate = a_tgt.get("sr")
+        if sample_rate is not None and sample_rate != current.get("asr"):
+            return mismatch
+        channels = a_tgt.get("ch")
+        if channels is not None and channels != current.get("ach"):
+            return mismatch
+        acodec = a_tgt.get("codec")
+        if acodec is not None and acodec != current.get("acodec"):
+            return mismatch
+
+        return False, prefer_copy
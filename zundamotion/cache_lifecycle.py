@@ -45,6 +45,7 @@ class CacheLifecycleMixin:
             return files
         threshold = time.time() - (self.ttl_hours * 3600)
         remaining = []
+        deleted: set[Path] = set()
         deleted_count = 0
         for item in files:
             path, _size, atime = item
@@ -52,6 +53,7 @@ class CacheLifecycleMixin:
                 remaining.append(item)
                 continue
             if self._delete_cache_path(path, reason="ttl_expired"):
+                deleted.update((path, *self._normalized_companion_paths(path)))
                 deleted_count += 1
         if deleted_count:
             logger.info(
@@ -59,24 +61,36 @@ class CacheLifecycleMixin:
                 deleted_count,
                 self.ttl_hours,
             )
-        return [item for item in remaining if item[0].exists()]
+        # 走査結果を再 stat せず、削除した本体と companion だけを除外する。
+        return [item for item in remaining if item[0] not in deleted]
 
     def _enforce_size_limit(self, files):
         if self.max_size_mb is None:
             return
         max_bytes = self.max_size_mb * 1024 * 1024
-        current_size = sum(size for path, size, _atime in files if path.exists())
+        current_size = sum(size for _path, size, _atime in files)
         if current_size <= max_bytes:
             return
-        files = sorted(files, key=lambda item: item[2])
+        # 経過時間で重み付けしたサイズ（経過時間 × サイズ）の大きい順に捨てる。
+        # 古くて大きいファイル 1 つで、最近使った小さいファイル群を守れる。
+        now = time.time()
+        files = sorted(
+            files,
+            key=lambda item: max(0.0, now - item[2]) * max(item[1], 1),
+            reverse=True,
+        )
+        deleted: set[Path] = set()
         deleted_size = 0
         deleted_count = 0
         for path, size, _atime in files:
             if current_size <= max_bytes:
                 break
-            if not path.exists():
+            if path in deleted:
+                # 先に消した normalized 本体/meta の companion。
+                current_size -= size
                 continue
             if self._delete_cache_path(path, reason="size_evicted"):
+                deleted.update((path, *self._normalized_companion_paths(path)))
                 current_size -= size
                 deleted_size += size
                 deleted_count += 1
@@ -11,8 +11,9 @@ import asyncio
 import json
 import sys
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .exceptions import CacheError
 from .utils import perf_stats
@@ -25,6 +26,10 @@ from .utils.logger import logger
 
 
 _PROBE_BUNDLE_SCHEMA_VERSION = 1
+# プロセス内で保持する probe bundle の上限。超過分は最も古い参照から捨てる。
+_PROBE_MEMO_MAX_ENTRIES = 2048
+
+_ProbeMemoKey = Tuple[str, int, int]
 
 
 def _public_probe_functions():
@@ -37,9 +42,67 @@ def _public_probe_functions():
     return info_func, duration_func
 
 
+def _bundle_has_value(bundle: Optional[Dict[str, Any]], request_kind: str) -> bool:
+    if bundle is None:
+        return False
+    if request_kind == "duration":
+        return bundle.get("duration") is not None
+    return isinstance(bundle.get("media_info"), dict)
+
+
+def _copy_media_info(media_info: Dict[str, Any]) -> Dict[str, Any]:
+    """memo の bundle を呼び出し側の変更から守るため、video/audio まで複製して返す。"""
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in media_info.items()
+    }
+
+
 class CacheMediaProbeMixin:
     """Store stream metadata and duration in one run/persistent cache bundle."""
 
+    def _probe_memo_store(self) -> "OrderedDict[_ProbeMemoKey, tuple[Dict[str, Any], Path]]":
+        memo = getattr(self, "_probe_memo", None)
+        if memo is None:
+            memo = OrderedDict()
+            self._probe_memo = memo
+        return memo
+
+    @staticmethod
+    def _probe_memo_key(file_path: Path) -> Optional[_ProbeMemoKey]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return (str(file_path), stat.st_size, stat.st_mtime_ns)
+
+    def _probe_memo_get(
+        self, memo_key: Optional[_ProbeMemoKey], request_kind: str
+    ) -> Optional[tuple[Dict[str, Any], Path]]:
+        """同一プロセス内で解析済みの bundle を返し、JSON の再読込を省く。"""
+        if memo_key is None:
+            return None
+        memo = self._probe_memo_store()
+        entry = memo.get(memo_key)
+        if entry is None or not _bundle_has_value(entry[0], request_kind):
+            return None
+        memo.move_to_end(memo_key)
+        return entry
+
+    def _probe_memo_put(
+        self,
+        memo_key: Optional[_ProbeMemoKey],
+        bundle: Dict[str, Any],
+        bundle_path: Path,
+    ) -> None:
+        if memo_key is None:
+            return
+        memo = self._probe_memo_store()
+        memo[memo_key] = (bundle, bundle_path)
+        memo.move_to_end(memo_key)
+        while len(memo) > _PROBE_MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+
     def _probe_bundle_path(self, file_path: Path) -> tuple[str, Path]:
         key_data = self._media_probe_cache_key_data(file_path, "media_probe_bundle")
         cache_key = self._generate_hash(key_data)
@@ -118,7 +181,7 @@ class CacheMediaProbeMixin:
         perf_stats.incr("cache_write")
         self._cache_diagnostics.mark_write(path)
         if not self.no_cache:
-            self._clean_cache()
+            self._maybe_clean_cache()
 
     def _record_probe_cache_hit(
         self,
@@ -178,6 +241,18 @@ class CacheMediaProbeMixin:
         caller: str,
         request_kind: str,
     ) -> tuple[Dict[str, Any], Path, bool]:
+        memo_key = self._probe_memo_key(file_path)
+        memoized = self._probe_memo_get(memo_key, request_kind)
+        if memoized is not None:
+            bundle, bundle_path = memoized
+            self._record_probe_cache_hit(
+                file_path=file_path,
+                path=bundle_path,
+                caller=caller,
+                kind=request_kind,
+            )
+            return bundle, bundle_path, True
+
         cache_key, bundle_path = self._probe_bundle_path(file_path)
         if self.no_cache:
             self._cache_diagnostics.record_status("disabled")
@@ -196,15 +271,8 @@ class CacheMediaProbeMixin:
                 self._write_probe_bundle(bundle_path, legacy)
                 bundle = legacy
 
-        requested_value_present = bool(
-            bundle is not None
-            and (
-                bundle.get("duration") is not None
-                if request_kind == "duration"
-                else isinstance(bundle.get("media_info"), dict)
-            )
-        )
-        if requested_value_present:
+        if _bundle_has_value(bundle, request_kind):
+            self._probe_memo_put(memo_key, bundle, bundle_path)
             self._record_probe_cache_hit(
                 file_path=file_path,
                 path=bundle_path,
@@ -223,15 +291,8 @@ class CacheMediaProbeMixin:
                 async def _create() -> Dict[str, Any]:
                     try:
                         current = self._read_probe_bundle(bundle_path)
-                        current_has_value = bool(
-                            current is not None
-                            and (
-                                current.get("duration") is not None
-                                if request_kind == "duration"
-                                else isinstance(current.get("media_info"), dict)
-                            )
-                        )
-                        if current_has_value:
+                        if _bundle_has_value(current, request_kind):
+                            self._probe_memo_put(memo_key, current, bundle_path)
                             return current
                         generated = await self._generate_probe_bundle(
                             file_path,
@@ -244,6 +305,7 @@ class CacheMediaProbeMixin:
                             if generated.get("duration") is None:
                                 generated["duration"] = current.get("duration")
                         self._write_probe_bundle(bundle_path, generated)
+                        self._probe_memo_put(memo_key, generated, bundle_path)
                         return generated
                     except Exception as exc:
                         raise CacheError(
@@ -266,7 +328,7 @@ class CacheMediaProbeMixin:
         caller: Optional[str] = None,
     ) -> MediaInfo:
         resolved_caller = str(caller or self._infer_probe_caller())
-        bundle, _path, _hit = await self._get_or_create_probe_bundle(
+        bundle, bundle_path, _hit = await self._get_or_create_probe_bundle(
             file_path,
             caller=resolved_caller,
             request_kind="media_info",
@@ -279,13 +341,13 @@ class CacheMediaProbeMixin:
                 caller=resolved_caller,
                 request_kind="media_info",
             )
+            # memo は同じ dict を保持しているため、更新はそのまま memo にも反映される。
             bundle.update(generated)
-            _cache_key, bundle_path = self._probe_bundle_path(file_path)
             self._write_probe_bundle(bundle_path, bundle)
             media_info = bundle.get("media_info")
         if not isinstance(media_info, dict):
             raise CacheError(f"Media info was not produced for {file_path.name}")
-        return media_info
+        return _copy_media_info(media_info)
 
     async def get_or_create_media_duration(
         self,
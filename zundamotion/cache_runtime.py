@@ -13,6 +13,7 @@ from .cache_base import (
 )
 from .cache_observability import CacheRunDiagnostics
 from .cache_signatures import FileSignatureMemo
+from .cache_storage import move_or_copy
 from .exceptions import CacheError
 from .utils import perf_stats
 from .utils.logger import logger
@@ -110,6 +111,26 @@ class CacheManager(_BaseCacheManager):
         self._cache_diagnostics.record_status("miss")
         return None
 
+    def _cached_copy_is_current(self, source_path: Path, cached_path: Path) -> bool:
+        """同じ内容キーの保存済みファイルが source より新しく同サイズなら再コピーを省く。
+
+        key が VOICEVOX のエンジン版や辞書を含まない呼び出し元もあるため、
+        サイズだけでは判定せず、保存後に作り直された source は必ずコピーする。
+        ``cache_refresh`` 時は明示的な上書き要求として常にコピーする。
+        """
+        if self.cache_refresh:
+            return False
+        with self._cache_diagnostics.measure("path_existence"):
+            try:
+                cached_stat = cached_path.stat()
+                source_stat = source_path.stat()
+            except OSError:
+                return False
+        return (
+            cached_stat.st_size == source_stat.st_size
+            and source_stat.st_mtime_ns < cached_stat.st_mtime_ns
+        )
+
     def cache_file(
         self,
         source_path: Path,
@@ -119,12 +140,16 @@ class CacheManager(_BaseCacheManager):
     ) -> Path:
         cache_key = self._generate_hash(key_data)
         cached_path = self.cache_dir / f"{file_name}_{cache_key}.{extension}"
+        if self._cached_copy_is_current(source_path, cached_path):
+            logger.debug("Cache entry already stored -> %s", cached_path.name)
+            return cached_path
+        # source_path は呼び出し側が保存後も使い続ける成果物なので、リンクで共有せず複製する
         with self._cache_diagnostics.measure("copy_store"):
             shutil.copy(source_path, cached_path)
         perf_stats.incr("cache_write")
         self._cache_diagnostics.mark_write(cached_path)
         logger.debug("Cached file -> %s", cached_path.name)
-        self._clean_cache()
+        self._maybe_clean_cache()
         return cached_path
 
     async def get_or_create(
@@ -172,11 +197,7 @@ class CacheManager(_BaseCacheManager):
                             generated_path = await creator_func(temp_output_path)
                             if generated_path != temp_output_path:
                                 with self._cache_diagnostics.measure("copy_store"):
-                                    shutil.copy(generated_path, temp_output_path)
-                                try:
-                                    generated_path.unlink()
-                                except Exception:
-                                    pass
+                                    move_or_copy(generated_path, temp_output_path)
                             return temp_output_path
                         finally:
                             async with self._inflight_lock:
@@ -233,12 +254,11 @@ class CacheManager(_BaseCacheManager):
                         generated_path = await creator_func(cached_path)
                         if generated_path != cached_path:
                             with self._cache_diagnostics.measure("copy_store"):
-                                shutil.copy(generated_path, cached_path)
-                            generated_path.unlink()
+                                move_or_copy(generated_path, cached_path)
                         logger.debug("Generated and cached file -> %s", cached_path.name)
                         perf_stats.incr("cache_write")
                         self._cache_diagnostics.mark_write(cached_path)
-                        self._clean_cache()
+                        await self._maybe_clean_cache_async()
                         return cached_path
                     except Exception as exc:
                         raise CacheError(
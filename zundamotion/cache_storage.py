@@ -0,0 +1,40 @@
+"""File placement helpers for storing generated artifacts in the cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+
+def link_or_copy(source_path: Path, cached_path: Path) -> None:
+    """Store ``source_path`` at ``cached_path`` by hard link, copying as fallback.
+
+    An existing ``cached_path`` is replaced.  Cross-device stores and
+    filesystems without hard-link support fall back to ``shutil.copy``.
+
+    A hard link makes both names alias one inode: rewriting either path in
+    place (for example ``ffmpeg -y`` onto it) changes the other, and size
+    accounting that sums ``st_size`` per name counts the bytes twice.  Only
+    use it for write-once files outside the size-limited cache directory.
+    Use ``move_or_copy`` when the source is disposable and ``shutil.copy``
+    when the caller keeps using it.
+    """
+    cached_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, cached_path)
+    except OSError:
+        shutil.copy(source_path, cached_path)
+
+
+def move_or_copy(generated_path: Path, target_path: Path) -> None:
+    """Move ``generated_path`` to ``target_path``, replacing any existing file.
+
+    A same-filesystem rename avoids a second full write of the artifact.
+    Cross-device moves fall back to copying and removing the source.
+    """
+    try:
+        os.replace(generated_path, target_path)
+    except OSError:
+        shutil.copy(generated_path, target_path)
+        generated_path.unlink(missing_ok=True)
@@ -1,7 +1,7 @@
 """Audio generation utilities and VOICEVOX client."""
 
 from .generator import AudioGenerator
-from .voicevox_client import generate_voice, get_speakers_info
+from .voicevox_client import generate_voice, get_speakers_info, voicevox_session
 
-__all__ = ["AudioGenerator", "generate_voice", "get_speakers_info"]
+__all__ = ["AudioGenerator", "generate_voice", "get_speakers_info", "voicevox_session"]
 
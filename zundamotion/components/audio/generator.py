@@ -1,11 +1,15 @@
-import os
+import asyncio
 import hashlib
+import json
+import math
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from ...cache import CacheManager  # CacheManagerをインポート
+from ...cache_storage import link_or_copy
 from ...exceptions import CacheError
 from ...utils.ffmpeg_params import AudioParams
 from ...utils.ffmpeg_audio import (
@@ -19,6 +23,7 @@ from ...utils.logger import logger  # loggerをインポート
 from .voicevox_client import (
     DEFAULT_VOICEVOX_REQUEST_TIMEOUT_SECONDS,
     generate_voice,
+    get_audio_query,
     get_engine_version,
     get_speakers_info,
 )
@@ -31,6 +36,7 @@ class AudioGenerator:
         temp_dir: Path,
         audio_params: AudioParams,
         cache_manager: CacheManager,  # CacheManagerインスタンスを受け取る
+        layer_workers: int = 2,
     ):
         self.config = config
         self.temp_dir = temp_dir
@@ -45,6 +51,10 @@ class AudioGenerator:
         self._engine_version_cache: Optional[str] = None
         self._dictionary_hash_cache: Optional[str] = None
         self._speaker_validation_unavailable = False
+        # 同じ尺の無音 WAV は実行中に一度だけ ffmpeg で作り、以降の行はリンクで使い回す。
+        self._silent_wav_memo: Dict[float, Path] = {}
+        # voice_layers の並列合成は行単位の audio_workers とは別枠になるため、同じ上限で絞る。
+        self._layer_semaphore = asyncio.Semaphore(max(1, int(layer_workers)))
         self.voice_request_timeout = float(
             self.voice_config.get(
                 "request_timeout", DEFAULT_VOICEVOX_REQUEST_TIMEOUT_SECONDS
@@ -139,6 +149,103 @@ class AudioGenerator:
             f"speaker ID. Available speaker IDs: {available_ids}. Examples: {examples}"
         )
 
+    async def _get_audio_query(
+        self,
+        text: str,
+        speaker: int,
+        engine_version: str,
+        dictionary_hash: str,
+    ) -> Dict[str, Any]:
+        """audio_query は speed/pitch に依存しないため、合成とは別キーでキャッシュする。"""
+        query_key_data = {
+            "kind": "voicevox_audio_query",
+            "text": text,
+            "speaker": speaker,
+            "voicevox_engine_version": engine_version,
+            "dictionary_hash": dictionary_hash,
+            "voicevox_url": self.voicevox_url,
+        }
+
+        async def creator_func(output_path: Path) -> Path:
+            query = await get_audio_query(
+                text,
+                speaker,
+                self.voicevox_url,
+                timeout=self.voice_request_timeout,
+                retry_attempts=self.voice_retry_attempts,
+                retry_wait_min=self.voice_retry_wait_min,
+                retry_wait_max=self.voice_retry_wait_max,
+            )
+            output_path.write_text(
+                json.dumps(query, ensure_ascii=False), encoding="utf-8"
+            )
+            return output_path
+
+        query_path = await self.cache_manager.get_or_create(
+            key_data=query_key_data,
+            file_name="voice_query",
+            extension="json",
+            creator_func=creator_func,
+        )
+        return json.loads(Path(query_path).read_text(encoding="utf-8"))
+
+    async def _layer_duration(
+        self, layer_audio_path: Path, layer_segments: List[Dict[str, Any]]
+    ) -> float:
+        # 音声付きレイヤーは合成時に測った尺をセグメントに持っているので ffprobe を省く
+        if layer_segments:
+            try:
+                return max(
+                    float(seg.get("start_time", 0.0)) + float(seg["duration"])
+                    for seg in layer_segments
+                )
+            except (KeyError, TypeError, ValueError):
+                pass
+        try:
+            return await self.cache_manager.get_or_create_media_duration(layer_audio_path)
+        except Exception:
+            return 0.0
+
+    async def _sound_effect_durations(
+        self, sound_effects: List[Dict[str, Any]]
+    ) -> List[float]:
+        """効果音の尺を ffprobe/cache 参照ごと並列に取得する。同じパスは一度だけ調べる。"""
+        unique_paths = list(dict.fromkeys(str(se["path"]) for se in sound_effects))
+        durations = await asyncio.gather(
+            *(
+                self.cache_manager.get_or_create_media_duration(Path(path))
+                for path in unique_paths
+            )
+        )
+        by_path = dict(zip(unique_paths, durations))
+        return [by_path[str(se["path"])] for se in sound_effects]
+
+    async def _create_silent_wav(self, output_path: Path, duration: float) -> None:
+        source = self._silent_wav_memo.get(duration)
+        if source is not None and source != output_path:
+            try:
+                await asyncio.to_thread(link_or_copy, source, output_path)
+                return
+            except OSError:
+                self._silent_wav_memo.pop(duration, None)
+        await create_silent_audio(
+            str(output_path),
+            duration,
+            self.intermediate_audio_params,
+        )
+        self._silent_wav_memo[duration] = output_path
+
+    async def _generate_layer_audio(
+        self, text: str, line_config: Dict[str, Any], output_filename: str
+    ) -> tuple[Path, List[Tuple[int, str]], List[Dict[str, Any]]]:
+        voice_layers = line_config.get("voice_layers")
+        if isinstance(voice_layers, list) and voice_layers:
+            # 入れ子のレイヤーは内側の葉レイヤーが枠を取るため、ここで保持すると
+            # layer_workers=1 のときに自分自身を待って止まる。
+            return await self.generate_audio(text, line_config, output_filename)
+        async with self._layer_semaphore:
+            return await self.generate_audio(text, line_config, output_filename)
+
     async def generate_audio(
         self, text: str, line_config: Dict[str, Any], output_filename: str
     ) -> tuple[Path, List[Tuple[int, str]], List[Dict[str, Any]]]:
@@ -167,6 +274,8 @@ class AudioGenerator:
             audio_tracks_to_mix: List[Tuple[str, float, float]] = []
             max_end_time = 0.0
 
+            layer_jobs: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+            layer_tasks = []
             for idx, layer in enumerate(voice_layers):
                 if not isinstance(layer, dict):
                     continue
@@ -186,24 +295,32 @@ class AudioGenerator:
                 }
                 layer_line_config.update(layer)
                 layer_line_config["sound_effects"] = []
+                layer_jobs.append((idx, layer, layer_line_config))
+                layer_tasks.append(
+                    self._generate_layer_audio(
+                        layer_text, layer_line_config, layer_output
+                    )
+                )
 
-                (
-                    layer_audio_path,
-                    layer_usage,
-                    layer_segments,
-                ) = await self.generate_audio(layer_text, layer_line_config, layer_output)
+            # 各レイヤーの VOICEVOX 合成と尺取得は互いに独立なので並列に待つ。
+            layer_results = await asyncio.gather(*layer_tasks)
+            layer_durations = await asyncio.gather(
+                *(
+                    self._layer_duration(Path(layer_audio_path), segments)
+                    for layer_audio_path, _usage, segments in layer_results
+                )
+            )
+
+            for (idx, layer, layer_line_config), (
+                layer_audio_path,
+                layer_usage,
+                layer_segments,
+            ), layer_duration in zip(layer_jobs, layer_results, layer_durations):
                 voice_usage.extend(layer_usage)
 
                 start_time = float(layer.get("start_time", 0.0))
                 volume = float(layer.get("volume", 1.0))
                 audio_tracks_to_mix.append((str(layer_audio_path), start_time, volume))
-
-                try:
-                    layer_duration = await self.cache_manager.get_or_create_media_duration(
-                        Path(layer_audio_path)
-                    )
-                except Exception:
-                    layer_duration = 0.0
                 max_end_time = max(max_end_time, start_time + layer_duration)
                 layer_speaker = layer.get("speaker_name") or layer_line_config.get(
                     "speaker_name"
@@ -232,12 +349,12 @@ class AudioGenerator:
                         }
                     )
 
-            for se in sound_effects:
+            se_durations = await self._sound_effect_durations(sound_effects)
+            for se, se_duration in zip(sound_effects, se_durations):
                 se_path = se["path"]
                 se_start_time = float(se.get("start_time", 0.0))
                 se_volume = float(se.get("volume", 1.0))
                 audio_tracks_to_mix.append((se_path, se_start_time, se_volume))
-                se_duration = await self.cache_manager.get_or_create_media_duration(Path(se_path))
                 max_end_time = max(max_end_time, se_start_time + se_duration)
 
             if not audio_tracks_to_mix:
@@ -260,15 +377,23 @@ class AudioGenerator:
             return mixed_wav_path, voice_usage, layer_voice_segments
 
         voice_enabled = bool(self.voice_config.get("enabled", True))
+        # 効果音の (path, start_time, volume, duration) は一度だけ集めて後段のミックスでも使い回す
+        se_tracks: List[Tuple[str, float, float, float]] = []
+        if sound_effects:
+            se_durations = await self._sound_effect_durations(sound_effects)
+            se_tracks = [
+                (
+                    se["path"],
+                    se.get("start_time", 0.0),
+                    se.get("volume", 1.0),
+                    se_duration,
+                )
+                for se, se_duration in zip(sound_effects, se_durations)
+            ]
         # Determine the required duration for the speech track based on SEs if text is empty
         required_speech_duration_for_ses = 0.0
-        if not text.strip() and sound_effects:
-            for se in sound_effects:
-                se_path = se["path"]
-                se_start_time = se.get("start_time", 0.0)
-                se_duration = await self.cache_manager.get_or_create_media_duration(
-                    Path(se_path)
-                )
+        if not text.strip() and se_tracks:
+            for _path, se_start_time, _volume, se_duration in se_tracks:
                 required_speech_duration_for_ses = max(
                     required_speech_duration_for_ses, se_start_time + se_duration
                 )
@@ -316,10 +441,19 @@ class AudioGenerator:
                 "intermediate_audio_format_version": INTERMEDIATE_AUDIO_FORMAT_VERSION,
                 "audio_mix_version": AUDIO_MIX_VERSION,
             }
+            speech_signature: Dict[str, Any] = voice_key_data
 
             async def creator_func(output_path: Path) -> Path:
                 logger.info(
-                    f"[Audio] Generating for '{text[:20]}...' with speaker_id={speaker}, speed={speed}, pitch={pitch} -> {output_path.name}"
+                    "[Audio] Generating for '%s...' with speaker_id=%s, speed=%s, pitch=%s -> %s",
+                    text[:20],
+                    speaker,
+                    speed,
+                    pitch,
+                    output_path.name,
+                )
+                audio_query = await self._get_audio_query(
+                    text, speaker, engine_version, dictionary_hash
                 )
                 await generate_voice(
                     text=text,
@@ -332,6 +466,7 @@ class AudioGenerator:
                     retry_attempts=self.voice_retry_attempts,
                     retry_wait_min=self.voice_retry_wait_min,
                     retry_wait_max=self.voice_retry_wait_max,
+                    audio_query=audio_query,
                 )
                 return output_path
 
@@ -384,14 +519,18 @@ class AudioGenerator:
                 0.001,
             )
             logger.info(
-                f"[Audio] Using silent WAV for {speech_wav_path.name} with duration {silent_duration}s"
-            )
-            await create_silent_audio(
-                str(speech_wav_path),
+                "[Audio] Using silent WAV for %s with duration %ss",
+                speech_wav_path.name,
                 silent_duration,
-                self.intermediate_audio_params,
             )
+            render_duration = silent_duration
+            if se_tracks:
+                # 効果音の終端は任意の小数になるため、下敷きの無音 WAV は 10ms 単位に切り上げて
+                # 使い回す。行の尺はミックスの total_duration で正確な値に切り詰める
+                render_duration = _quantize_silence_duration(silent_duration)
+            await self._create_silent_wav(speech_wav_path, render_duration)
             speech_duration = silent_duration
+            speech_signature = {"kind": "silence", "duration": render_duration}
 
         # Handle sound effects
         # sound_effects = line_config.get("sound_effects", []) # Already retrieved above
@@ -407,26 +546,64 @@ class AudioGenerator:
 
         max_end_time = speech_duration
 
-        for se in sound_effects:
-            se_path = se["path"]
-            se_start_time = se.get("start_time", 0.0)
-            se_volume = se.get("volume", 1.0)
+        for se_path, se_start_time, se_volume, se_duration in se_tracks:
             audio_tracks_to_mix.append((se_path, se_start_time, se_volume))
-            se_duration = await self.cache_manager.get_or_create_media_duration(Path(se_path))
             max_end_time = max(max_end_time, se_start_time + se_duration)
 
-        # Mix all audio tracks
-        mixed_wav_path = self.temp_dir / f"{output_filename}_mixed.wav"
-        await mix_audio_tracks(
-            audio_tracks_to_mix,
-            str(mixed_wav_path),
-            total_duration=max_end_time,
-            audio_params=self.intermediate_audio_params,
+        # 音声と効果音の組み合わせが同じなら前回のミックス結果をキャッシュから再利用する
+        mix_key_data = {
+            "kind": "speech_se_mix",
+            "speech": speech_signature,
+            "sound_effects": [
+                (_file_signature(se_path), se_start_time, se_volume)
+                for se_path, se_start_time, se_volume, _duration in se_tracks
+            ],
+            "total_duration": max_end_time,
+            "audio_params": self.intermediate_audio_params.__dict__,
+            "intermediate_audio_format_version": INTERMEDIATE_AUDIO_FORMAT_VERSION,
+            "audio_mix_version": AUDIO_MIX_VERSION,
+        }
+
+        async def mix_creator(_output_path: Path) -> Path:
+            # キャッシュ実体へ直接書くと失敗時の書きかけがヒット扱いになるため、
+            # 一時パスへ描画して成功時だけ get_or_create に取り込ませる
+            temp_mix_path = self.temp_dir / f"{output_filename}_mixed.wav"
+            try:
+                await mix_audio_tracks(
+                    audio_tracks_to_mix,
+                    str(temp_mix_path),
+                    total_duration=max_end_time,
+                    audio_params=self.intermediate_audio_params,
+                )
+            except BaseException:
+                temp_mix_path.unlink(missing_ok=True)
+                raise
+            return temp_mix_path
+
+        mixed_wav_path = await self.cache_manager.get_or_create(
+            key_data=mix_key_data,
+            file_name="speech_se_mix",
+            extension="wav",
+            creator_func=mix_creator,
         )
 
         return mixed_wav_path, voice_usage, layer_voice_segments
 
 
+def _file_signature(path: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """キャッシュキー用に (path, size, mtime_ns) を返す。stat できなければ None を入れる。"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), st.st_size, st.st_mtime_ns)
+
+
+def _quantize_silence_duration(duration: float) -> float:
+    """無音尺を 10ms 単位に切り上げる（浮動小数の誤差で 1 段上がらないよう丸めてから）。"""
+    return math.ceil(round(duration * 100, 6)) / 100
+
+
 def _estimate_silent_duration(
     text: str,
     line_config: Dict[str, Any],
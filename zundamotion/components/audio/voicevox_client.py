@@ -1,12 +1,56 @@
 import asyncio
 import json
-from typing import Any, Dict, List
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
+from ...utils.logger import logger
+
 
 RETRY_EXCEPTIONS = (httpx.RequestError, asyncio.TimeoutError)
 DEFAULT_VOICEVOX_REQUEST_TIMEOUT_SECONDS = 30.0
+_KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=32)
+_SYNTHESIS_CHUNK_SIZE = 1 << 16
+
+# voicevox_session() の間だけ URL 単位で AsyncClient を共有する。
+# セッション内で作られたタスクは同じ dict を引き継ぐ。
+_SESSION_CLIENTS: ContextVar[Optional[Dict[str, httpx.AsyncClient]]] = ContextVar(
+    "voicevox_session_clients", default=None
+)
+
+
+@asynccontextmanager
+async def voicevox_session() -> AsyncIterator[None]:
+    """ブロック内の VOICEVOX 呼び出しで keep-alive 接続を共有し、抜けるときに閉じる。
+
+    入れ子で使った場合は一番外側のセッションが接続を閉じる。
+    """
+    if _SESSION_CLIENTS.get() is not None:
+        yield
+        return
+    clients: Dict[str, httpx.AsyncClient] = {}
+    token = _SESSION_CLIENTS.set(clients)
+    try:
+        yield
+    finally:
+        _SESSION_CLIENTS.reset(token)
+        for client in clients.values():
+            await client.aclose()
+
+
+def _get_client(voicevox_url: str) -> httpx.AsyncClient:
+    """現在の voicevox_session() で共有する AsyncClient を返す。"""
+    clients = _SESSION_CLIENTS.get()
+    if clients is None:
+        raise RuntimeError("VOICEVOX client requested outside voicevox_session().")
+    client = clients.get(voicevox_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=_KEEPALIVE_LIMITS)
+        clients[voicevox_url] = client
+    return client
 
 
 async def _with_retry(
@@ -44,39 +88,43 @@ async def get_speakers_info(
     """
 
     async def _fetch() -> Dict[int, Dict[str, Any]]:
-        async with httpx.AsyncClient() as client:
-            res = await client.get(f"{voicevox_url}/speakers", timeout=timeout)
-            res.raise_for_status()
-            speakers_data: List[Dict[str, Any]] = res.json()
-
-            speaker_info = {}
-            for speaker_group in speakers_data:
-                for speaker in speaker_group.get("styles", []):
-                    speaker_info[speaker["id"]] = {
-                        "name": speaker["name"],
-                        "speaker_name": speaker_group["name"],
-                    }
-            return speaker_info
+        client = _get_client(voicevox_url)
+        res = await client.get(f"{voicevox_url}/speakers", timeout=timeout)
+        res.raise_for_status()
+        speakers_data: List[Dict[str, Any]] = res.json()
+
+        speaker_info = {}
+        for speaker_group in speakers_data:
+            for speaker in speaker_group.get("styles", []):
+                speaker_info[speaker["id"]] = {
+                    "name": speaker["name"],
+                    "speaker_name": speaker_group["name"],
+                }
+        return speaker_info
 
     try:
-        return await _with_retry(
-            _fetch,
-            attempts=retry_attempts,
-            wait_min=retry_wait_min,
-            wait_max=retry_wait_max,
-        )
+        async with voicevox_session():
+            return await _with_retry(
+                _fetch,
+                attempts=retry_attempts,
+                wait_min=retry_wait_min,
+                wait_max=retry_wait_max,
+            )
     except httpx.RequestError as e:
-        print(f"Failed to connect to VOICEVOX to get speaker info: {e}")
-        print("Please ensure the VOICEVOX engine is running.")
+        logger.error(
+            "Failed to connect to VOICEVOX to get speaker info: %s. "
+            "Please ensure the VOICEVOX engine is running.",
+            e,
+        )
         raise
     except httpx.HTTPStatusError as e:
-        print(f"HTTP error occurred during speaker info retrieval: {e}")
+        logger.error("HTTP error occurred during speaker info retrieval: %s", e)
         raise
     except asyncio.TimeoutError as e:
-        print(f"Timeout occurred during speaker info retrieval: {e}")
+        logger.error("Timeout occurred during speaker info retrieval: %s", e)
         raise
     except Exception as e:
-        print(f"An unexpected error occurred during speaker info retrieval: {e}")
+        logger.error("An unexpected error occurred during speaker info retrieval: %s", e)
         raise
 
 
@@ -91,22 +139,84 @@ async def get_engine_version(
     """Fetch VOICEVOX engine version when the endpoint is available."""
 
     async def _fetch() -> str:
-        async with httpx.AsyncClient() as client:
-            res = await client.get(f"{voicevox_url}/version", timeout=timeout)
-            res.raise_for_status()
-            return str(res.json() if res.headers.get("content-type", "").startswith("application/json") else res.text).strip().strip('"')
+        client = _get_client(voicevox_url)
+        res = await client.get(f"{voicevox_url}/version", timeout=timeout)
+        res.raise_for_status()
+        return str(res.json() if res.headers.get("content-type", "").startswith("application/json") else res.text).strip().strip('"')
 
     try:
-        return await _with_retry(
-            _fetch,
-            attempts=retry_attempts,
-            wait_min=retry_wait_min,
-            wait_max=retry_wait_max,
-        )
+        async with voicevox_session():
+            return await _with_retry(
+                _fetch,
+                attempts=retry_attempts,
+                wait_min=retry_wait_min,
+                wait_max=retry_wait_max,
+            )
     except Exception:
         return "unknown"
 
 
+async def _fetch_audio_query(
+    client: httpx.AsyncClient,
+    voicevox_url: str,
+    text: str,
+    speaker: int,
+    timeout: float,
+) -> Dict[str, Any]:
+    res_query = await client.post(
+        f"{voicevox_url}/audio_query",
+        params={"text": text, "speaker": speaker},
+        timeout=timeout,
+    )
+    res_query.raise_for_status()
+    return res_query.json()
+
+
+async def get_audio_query(
+    text: str,
+    speaker: int,
+    voicevox_url: str = "http://127.0.0.1:50021",
+    *,
+    timeout: float = DEFAULT_VOICEVOX_REQUEST_TIMEOUT_SECONDS,
+    retry_attempts: int = 3,
+    retry_wait_min: float = 1.0,
+    retry_wait_max: float = 3.0,
+) -> Dict[str, Any]:
+    """Fetch the VOICEVOX ``audio_query`` for ``(text, speaker)``.
+
+    The query does not depend on speed or pitch, so callers can persist it
+    and pass it back to :func:`generate_voice` when only those change.
+    """
+
+    async def _fetch() -> Dict[str, Any]:
+        client = _get_client(voicevox_url)
+        return await _fetch_audio_query(client, voicevox_url, text, speaker, timeout)
+
+    try:
+        async with voicevox_session():
+            return await _with_retry(
+                _fetch,
+                attempts=retry_attempts,
+                wait_min=retry_wait_min,
+                wait_max=retry_wait_max,
+            )
+    except httpx.RequestError as e:
+        logger.error(
+            "Failed to connect to VOICEVOX: %s. Please ensure the VOICEVOX engine is running.",
+            e,
+        )
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error("HTTP error occurred during audio query: %s", e)
+        raise
+    except asyncio.TimeoutError as e:
+        logger.error("Timeout occurred during audio query: %s", e)
+        raise
+    except Exception as e:
+        logger.error("An unexpected error occurred during audio query: %s", e)
+        raise
+
+
 async def generate_voice(
     text: str,
     speaker: int,
@@ -119,45 +229,67 @@ async def generate_voice(
     retry_attempts: int = 3,
     retry_wait_min: float = 1.0,
     retry_wait_max: float = 3.0,
+    audio_query: Optional[Dict[str, Any]] = None,
 ):
     """
     Generate a voice file using the VOICEVOX API with a bounded retry budget.
+
+    When ``audio_query`` is given, the ``audio_query`` request is skipped and
+    only ``synthesis`` is called.
     """
 
     async def _generate() -> None:
-        async with httpx.AsyncClient() as client:
-            query_params = {"text": text, "speaker": speaker}
-            res_query = await client.post(
-                f"{voicevox_url}/audio_query", params=query_params, timeout=timeout
-            )
-            res_query.raise_for_status()
-            query_data = res_query.json()
-
-            query_data["speedScale"] = speed
-            query_data["pitchScale"] = pitch
-            synth_params = {"speaker": speaker}
-            res_synth = await client.post(
-                f"{voicevox_url}/synthesis",
-                params=synth_params,
-                content=json.dumps(query_data),
-                headers={"Content-Type": "application/json"},
-                timeout=timeout,
+        client = _get_client(voicevox_url)
+        if audio_query is None:
+            query_data = await _fetch_audio_query(
+                client, voicevox_url, text, speaker, timeout
             )
-            res_synth.raise_for_status()
+        else:
+            query_data = dict(audio_query)
 
-            with open(filepath, "wb") as f:
-                f.write(res_synth.content)
+        query_data["speedScale"] = speed
+        query_data["pitchScale"] = pitch
+        synth_params = {"speaker": speaker}
+        # WAV 全体をメモリに載せず、受信したチャンクをそのままファイルへ書き出す
+        async with client.stream(
+            "POST",
+            f"{voicevox_url}/synthesis",
+            params=synth_params,
+            content=json.dumps(query_data),
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        ) as res_synth:
+            if res_synth.is_error:
+                await res_synth.aread()
+            res_synth.raise_for_status()
+            # filepath はキャッシュ実体なので、途中で切れた WAV がヒット扱いに
+            # ならないよう一時ファイルへ受信し、完了後に置き換える
+            part_path = f"{filepath}.part"
+            try:
+                with open(part_path, "wb") as f:
+                    async for chunk in res_synth.aiter_bytes(_SYNTHESIS_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(part_path, filepath)
+            except BaseException:
+                try:
+                    os.unlink(part_path)
+                except FileNotFoundError:
+                    pass
+                raise
 
     try:
-        await _with_retry(
-            _generate,
-            attempts=retry_attempts,
-            wait_min=retry_wait_min,
-            wait_max=retry_wait_max,
-        )
+        async with voicevox_session():
+            await _with_retry(
+                _generate,
+                attempts=retry_attempts,
+                wait_min=retry_wait_min,
+                wait_max=retry_wait_max,
+            )
     except httpx.RequestError as e:
-        print(f"Failed to connect to VOICEVOX: {e}")
-        print("Please ensure the VOICEVOX engine is running.")
+        logger.error(
+            "Failed to connect to VOICEVOX: %s. Please ensure the VOICEVOX engine is running.",
+            e,
+        )
         raise
     except httpx.HTTPStatusError as e:
         body = ""
@@ -165,11 +297,11 @@ async def generate_voice(
             body_text = e.response.text.strip()
             if body_text:
                 body = f" Response body: {body_text[:500]}"
-        print(f"HTTP error occurred during voice generation: {e}.{body}")
+        logger.error("HTTP error occurred during voice generation: %s.%s", e, body)
         raise
     except asyncio.TimeoutError as e:
-        print(f"Timeout occurred during voice generation: {e}")
+        logger.error("Timeout occurred during voice generation: %s", e)
         raise
     except Exception as e:
-        print(f"An unexpected error occurred during voice generation: {e}")
+        logger.error("An unexpected error occurred during voice generation: %s", e)
         raise
@@ -5,6 +5,11 @@ from yaml import YAMLError
 
 from ...exceptions import ValidationError
 
+try:  # libyaml があればCパーサーで読み込む（SafeLoaderと同じ構築結果）
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:  # pragma: no cover - libyaml無しのPyYAML
+    from yaml import SafeLoader as SafeYamlLoader  # type: ignore[assignment]
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load a YAML configuration file with friendly validation errors.
@@ -25,7 +30,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
     """
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeYamlLoader)
     except YAMLError as e:
         mark = getattr(e, "mark", None)
         line = mark.line + 1 if mark else None
@@ -3,7 +3,6 @@
 Script traversal and domain-specific validators live in adjacent modules.
 """
 
-from pathlib import Path
 from typing import Any, Dict
 
 from ...exceptions import ValidationError
@@ -23,6 +22,8 @@ from .validate_common import (
     IMAGE_LAYER_TRANSITION_TYPES,
     RGB_COLOR_RE,
     is_valid_color_string as _is_valid_color_string,
+    path_kind,
+    path_kind_cache,
     validate_character_color_filter,
 )
 from .validate_layers import _validate_image_layer_transition, _validate_image_layers
@@ -102,10 +103,10 @@ def _validate_bgm_layer(layer_id: str, layer: Dict[str, Any]) -> None:
     file_path = layer.get("file")
     if not isinstance(file_path, str) or not file_path.strip():
         raise ValidationError(f"bgm_layers '{layer_id}' must have a 'file' path.")
-    file_full_path = Path(file_path)
-    if not file_full_path.exists():
+    kind = path_kind(file_path)
+    if kind is None:
         raise ValidationError(f"bgm_layers '{layer_id}' file '{file_path}' does not exist.")
-    if not file_full_path.is_file():
+    if not kind:
         raise ValidationError(f"bgm_layers '{layer_id}' file '{file_path}' is not a file.")
     gain = layer.get("gain")
     if gain is not None and not isinstance(gain, (int, float)):
@@ -162,6 +163,11 @@ def _validate_transitions(config: Dict[str, Any]) -> None:
 
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate the loaded configuration and script data."""
+    with path_kind_cache():
+        _validate_config(config)
+
+
+def _validate_config(config: Dict[str, Any]) -> None:
     plugins_cfg = config.get("plugins")
     if plugins_cfg is not None:
         _validate_plugins_config(plugins_cfg)
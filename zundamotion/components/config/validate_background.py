@@ -1,10 +1,14 @@
 """Background configuration validation."""
 
-from pathlib import Path
 from typing import Any, Dict
 
 from ...exceptions import ValidationError
-from .validate_common import ANCHOR_CHOICES, BACKGROUND_FIT_CHOICES, is_valid_color_string
+from .validate_common import (
+    ANCHOR_CHOICES,
+    BACKGROUND_FIT_CHOICES,
+    is_valid_color_string,
+    path_kind,
+)
 
 
 def _validate_background_options(
@@ -16,8 +20,7 @@ def _validate_background_options(
             raise ValidationError(
                 f"Background path for {container_id} must be a string."
             )
-        resolved = Path(bg_path)
-        if not resolved.exists() or not resolved.is_file():
+        if not path_kind(bg_path):
             raise ValidationError(
                 f"Background path '{bg_path}' not found for {container_id}."
             )
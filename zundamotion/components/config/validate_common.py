@@ -1,62 +1,111 @@
 """Shared constants and value checks for configuration validation."""
 
+import os
 import re
-from typing import Any
+import stat
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
 
 from ...exceptions import ValidationError
 
-BACKGROUND_FIT_CHOICES = {
-    "stretch",
-    "contain",
-    "cover",
-    "fit_width",
-    "fit_height",
-}
-
-ANCHOR_CHOICES = {
-    "top_left",
-    "top_center",
-    "top_right",
-    "middle_left",
-    "middle_center",
-    "middle_right",
-    "bottom_left",
-    "bottom_center",
-    "bottom_right",
-}
-
-IMAGE_LAYER_TRANSITION_TYPES = {
-    "fade",
-    "none",
-}
-BADGE_POSITION_CHOICES = {
-    "top-left",
-    "top-center",
-    "top-right",
-    "bottom-left",
-    "bottom-center",
-    "bottom-right",
-}
+BACKGROUND_FIT_CHOICES = frozenset(
+    {
+        "stretch",
+        "contain",
+        "cover",
+        "fit_width",
+        "fit_height",
+    }
+)
+
+ANCHOR_CHOICES = frozenset(
+    {
+        "top_left",
+        "top_center",
+        "top_right",
+        "middle_left",
+        "middle_center",
+        "middle_right",
+        "bottom_left",
+        "bottom_center",
+        "bottom_right",
+    }
+)
+
+IMAGE_LAYER_TRANSITION_TYPES = frozenset(
+    {
+        "fade",
+        "none",
+    }
+)
+BADGE_POSITION_CHOICES = frozenset(
+    {
+        "top-left",
+        "top-center",
+        "top-right",
+        "bottom-left",
+        "bottom-center",
+        "bottom-right",
+    }
+)
+
+# 1回の validate_config 内で同じ素材パスを再statしないためのキャッシュ
+_PATH_KIND_CACHE: ContextVar[Optional[Dict[str, Optional[bool]]]] = ContextVar(
+    "config_validation_path_kind_cache", default=None
+)
 
 HEX_COLOR_RE = re.compile(r"^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
 RGB_COLOR_RE = re.compile(r"^rgba?\(.*\)$", re.IGNORECASE)
 HSL_COLOR_RE = re.compile(r"^hsla?\(.*\)$", re.IGNORECASE)
 
 
+@contextmanager
+def path_kind_cache() -> Iterator[None]:
+    """Share stat results for the duration of one validation pass."""
+    token = _PATH_KIND_CACHE.set({})
+    try:
+        yield
+    finally:
+        _PATH_KIND_CACHE.reset(token)
+
+
+def path_kind(path: Any) -> Optional[bool]:
+    """Return None if missing, True for a regular file, False otherwise.
+
+    exists()/is_file() の2回statを1回にまとめ、キャッシュ有効時は同じパスを再statしない。
+    """
+    key = os.fspath(path)
+    cache = _PATH_KIND_CACHE.get()
+    if cache is not None and key in cache:
+        return cache[key]
+    try:
+        result: Optional[bool] = stat.S_ISREG(os.stat(key).st_mode)
+    except (OSError, ValueError):
+        result = None
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
 def is_valid_color_string(value: str) -> bool:
-    if HEX_COLOR_RE.match(value):
+    if not value:
+        return False
+    # 先頭文字で形式を振り分け、該当しない正規表現の照合を省く
+    head = value[0]
+    if head == "#":
+        return HEX_COLOR_RE.match(value) is not None
+    if head in "rR" and RGB_COLOR_RE.match(value):
         return True
-    if RGB_COLOR_RE.match(value) or HSL_COLOR_RE.match(value):
+    if head in "hH" and HSL_COLOR_RE.match(value):
         return True
-    if value.lower().startswith("0x"):
+    if head == "0" and value[1:2] in ("x", "X"):
         try:
             int(value[2:], 16)
             return True
         except ValueError:
             return False
-    if value.isalpha():
-        return True
-    return False
+    return value.isalpha()
 
 
 def validate_character_color_filter(color_filter: Any, label: str) -> None:
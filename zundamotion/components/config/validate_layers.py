@@ -1,10 +1,9 @@
 """Image layer configuration validation."""
 
-from pathlib import Path
 from typing import Any, Dict
 
 from ...exceptions import ValidationError
-from .validate_common import ANCHOR_CHOICES, IMAGE_LAYER_TRANSITION_TYPES
+from .validate_common import ANCHOR_CHOICES, IMAGE_LAYER_TRANSITION_TYPES, path_kind
 
 
 def _validate_image_layer_transition(
@@ -78,7 +77,7 @@ def _validate_show_source(show: Dict[str, Any], layer_id: str, container_id: str
         raise ValidationError(
             f"Image layer '{layer_id}' show in {container_id} requires a string 'path'."
         )
-    if not Path(path).is_file():
+    if not path_kind(path):
         raise ValidationError(
             f"Image layer '{layer_id}' show path '{path}' not found for {container_id}."
         )
@@ -1,10 +1,13 @@
 """Foreground overlay configuration validation."""
 
-from pathlib import Path
 from typing import Any, Dict
 
 from ...exceptions import ValidationError
 from ...utils.filter_presets import VIDEO_FILTER_PRESETS
+from .validate_common import path_kind
+
+# 未指定時の既定値。検証は読み取りのみなので、overlayごとに空dictを作らず共有する
+_EMPTY_DICT: Dict[str, Any] = {}
 
 
 def _validate_fg_overlays(container: Dict[str, Any], container_id: str) -> None:
@@ -22,7 +25,7 @@ def _validate_fg_overlay(overlay: Any, container_id: str, index: int) -> None:
         raise ValidationError(
             f"Foreground overlay at {container_id}, index {index} must be a dictionary."
         )
-    overlay_id = overlay.get("id", f"fg_{index}")
+    overlay_id = overlay["id"] if "id" in overlay else f"fg_{index}"
     _validate_source(overlay, overlay_id, container_id)
     _validate_filter(overlay, overlay_id, container_id)
     _validate_mode(overlay, overlay_id, container_id)
@@ -37,7 +40,7 @@ def _validate_source(overlay: Dict[str, Any], overlay_id: str, container_id: str
         raise ValidationError(
             f"Foreground overlay '{overlay_id}' in {container_id} must have a string 'src' path."
         )
-    if not Path(source).is_file():
+    if not path_kind(source):
         raise ValidationError(
             f"Foreground overlay '{overlay_id}' source file '{source}' not found for {container_id}."
         )
@@ -102,7 +105,7 @@ def _validate_placement(overlay: Dict[str, Any], overlay_id: str, container_id:
         raise ValidationError(
             f"Foreground overlay '{overlay_id}' in {container_id} opacity must be between 0.0 and 1.0."
         )
-    position = overlay.get("position", {})
+    position = overlay.get("position", _EMPTY_DICT)
     if not isinstance(position, dict):
         raise ValidationError(
             f"Foreground overlay '{overlay_id}' in {container_id} position must be a dictionary."
@@ -112,7 +115,7 @@ def _validate_placement(overlay: Dict[str, Any], overlay_id: str, container_id:
             raise ValidationError(
                 f"Foreground overlay '{overlay_id}' in {container_id} position '{axis}' must be a number."
             )
-    _validate_scale(overlay.get("scale", {}), overlay_id, container_id)
+    _validate_scale(overlay.get("scale", _EMPTY_DICT), overlay_id, container_id)
 
 
 def _validate_scale(scale: Any, overlay_id: str, container_id: str) -> None:
@@ -140,7 +143,7 @@ def _validate_scale(scale: Any, overlay_id: str, container_id: str) -> None:
 
 
 def _validate_timing(overlay: Dict[str, Any], overlay_id: str, container_id: str) -> None:
-    timing = overlay.get("timing", {})
+    timing = overlay.get("timing", _EMPTY_DICT)
     if not isinstance(timing, dict):
         raise ValidationError(
             f"Foreground overlay '{overlay_id}' in {container_id} timing must be a dictionary."
@@ -1,6 +1,5 @@
 """Scene and line traversal for configuration validation."""
 
-from pathlib import Path
 from typing import Any, Dict, List
 
 from ...exceptions import ValidationError
@@ -13,7 +12,7 @@ from .validate_badges import (
 )
 from .validate_layers import _validate_image_layers
 from .validate_overlays import _validate_fg_overlays
-from .validate_common import validate_character_color_filter
+from .validate_common import path_kind, validate_character_color_filter
 
 
 def _line_from_item(scene_id: str, item: Dict[str, Any], idx: int) -> Dict[str, Any] | None:
@@ -121,10 +120,10 @@ def _validate_scene_settings(config: Dict[str, Any], scene: Dict[str, Any], scen
 
 
 def _validate_file_path(path: str, label: str) -> None:
-    resolved = Path(path)
-    if not resolved.exists():
+    kind = path_kind(path)
+    if kind is None:
         raise ValidationError(f"{label} does not exist.")
-    if not resolved.is_file():
+    if not kind:
         raise ValidationError(f"{label.replace('file', 'path')} is not a file.")
 
 
@@ -158,10 +157,10 @@ def _validate_scene_transition(scene: Dict[str, Any], scene_id: str) -> None:
 
 def _validate_top_level_assets(config: Dict[str, Any]) -> None:
     for asset_key, asset_path in config.get("assets", {}).items():
-        resolved = Path(asset_path)
-        if not resolved.exists():
+        kind = path_kind(asset_path)
+        if kind is None:
             raise ValidationError(f"Asset '{asset_key}' path '{asset_path}' does not exist.")
-        if not resolved.is_file():
+        if not kind:
             raise ValidationError(f"Asset '{asset_key}' path '{asset_path}' is not a file.")
 
 
@@ -192,14 +191,19 @@ def _validate_line_features(line: Dict[str, Any], scene_id: str, line_idx: int)
                 raise ValidationError(
                     f"Character asset_name at {container_id}, index {char_idx} must be a non-empty string."
                 )
-            validate_character_color_filter(
-                character.get("color_filter"),
-                f"{container_id}, characters[{char_idx}].color_filter",
-            )
-            _validate_character_move(
-                character.get("move"),
-                f"{container_id}, characters[{char_idx}].move",
-            )
+            # 大半のキャラクター指定は color_filter/move を持たないため、ラベル生成ごと省く
+            color_filter = character.get("color_filter")
+            if color_filter is not None:
+                validate_character_color_filter(
+                    color_filter,
+                    f"{container_id}, characters[{char_idx}].color_filter",
+                )
+            move = character.get("move")
+            if move is not None:
+                _validate_character_move(
+                    move,
+                    f"{container_id}, characters[{char_idx}].move",
+                )
     reset_flag = line.get("reset_characters")
     if reset_flag is not None and not isinstance(reset_flag, bool):
         raise ValidationError(
@@ -300,10 +304,10 @@ def _validate_sound_effect(sound_effect: Any, scene_id: str, line_idx: int, se_i
     path = sound_effect.get("path")
     if not path:
         raise ValidationError(f"Sound effect at {label} must have a 'path'.")
-    resolved = Path(path)
-    if not resolved.exists():
+    kind = path_kind(path)
+    if kind is None:
         raise ValidationError(f"Sound effect file '{path}' for {label} does not exist.")
-    if not resolved.is_file():
+    if not kind:
         raise ValidationError(f"Sound effect path '{path}' for {label} is not a file.")
     start_time = sound_effect.get("start_time", 0.0)
     if not isinstance(start_time, (int, float)):
@@ -382,7 +386,6 @@ def _validate_scene(config: Dict[str, Any], scene: Any, scene_idx: int) -> None:
     _validate_badge_definitions_list(
         scene.get("badges"), container_id=f"scene '{scene_id}'", label="badges"
     )
-    _validate_top_level_assets(config)
     for line_idx, line in enumerate(_resolve_scene_lines(scene_id, scene)):
         _validate_line(line, scene_id, line_idx)
 
@@ -393,5 +396,8 @@ def validate_script(config: Dict[str, Any], script: Dict[str, Any]) -> None:
     if not isinstance(scenes, list):
         raise ValueError("Script must contain a 'scenes' list.")
     _validate_badge_definitions_list(script.get("badges"), container_id="script", label="badges")
+    # 共有アセットはシーン数に関係なく1回だけ検証する（シーンが無い台本では従来どおり検証しない）
+    if scenes:
+        _validate_top_level_assets(config)
     for scene_idx, scene in enumerate(scenes):
         _validate_scene(config, scene, scene_idx)
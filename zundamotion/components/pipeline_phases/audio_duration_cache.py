@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from zundamotion.utils import perf_stats
+from zundamotion.utils.ffmpeg_probe import read_wav_duration
 from zundamotion.utils.logger import logger
 
 
@@ -21,11 +22,7 @@ class AudioDurationCacheProxy:
 
     @staticmethod
     def _wav_duration(file_path: Path) -> float:
-        with wave.open(str(file_path), "rb") as reader:
-            frame_rate = int(reader.getframerate())
-            if frame_rate <= 0:
-                raise ValueError("WAV frame rate must be positive")
-            return float(reader.getnframes()) / float(frame_rate)
+        return read_wav_duration(file_path)
 
     async def get_or_create_media_duration(
         self,
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from zundamotion.cache import CacheManager
 from zundamotion.components.audio import AudioGenerator
@@ -22,6 +22,7 @@ from zundamotion.utils.face_anim import (
 from zundamotion.utils.logger import logger
 
 from .audio_duration_cache import AudioDurationCacheProxy
+from .audio_phase_face_anim import FaceAnimSettings
 from .audio_phase_run import AudioPhaseRunMixin
 from .audio_worker_policy import AudioWorkerPolicy, resolve_audio_worker_policy
 
@@ -38,9 +39,6 @@ class AudioPhase(AudioPhaseRunMixin):
         self.temp_dir = temp_dir
         self.cache_manager = AudioDurationCacheProxy(cache_manager)
         self.audio_params = audio_params
-        self.audio_gen = AudioGenerator(
-            self.config, self.temp_dir, audio_params, self.cache_manager
-        )  # cache_managerを渡す
         self.video_extensions = self.config.get("system", {}).get(
             "video_extensions",
             [".mp4", ".mov", ".webm", ".avi", ".mkv"],
@@ -48,6 +46,7 @@ class AudioPhase(AudioPhaseRunMixin):
         self.used_voicevox_info: List[Tuple[int, str]] = (
             []
         )  # Initialize list to store (speaker_id, text)
+        self._face_anim_settings: Optional[FaceAnimSettings] = None
         policy = self._resolve_audio_worker_policy()
         self.audio_workers = max(1, int(self._determine_audio_workers()))
         if self.audio_workers != policy.resolved:
@@ -59,6 +58,13 @@ class AudioPhase(AudioPhaseRunMixin):
                 fallback_reason="determine_audio_workers_override",
             )
         self.audio_worker_policy = policy
+        self.audio_gen = AudioGenerator(
+            self.config,
+            self.temp_dir,
+            audio_params,
+            self.cache_manager,
+            layer_workers=self.audio_workers,
+        )  # cache_managerを渡す
         logger.info(
             "[AudioConcurrency] requested=%s resolved=%d source=%s automatic=%s fallback=%s",
             self.audio_worker_policy.requested,
@@ -76,6 +82,13 @@ class AudioPhase(AudioPhaseRunMixin):
             cpu_count=os.cpu_count(),
         )
 
+    def face_anim_settings(self) -> FaceAnimSettings:
+        """Return video.face_anim settings, parsed once per phase."""
+        # 行ごとに同じ設定を読み直さないよう、初回の発話行で解析して保持する
+        if self._face_anim_settings is None:
+            self._face_anim_settings = FaceAnimSettings.from_config(self.config)
+        return self._face_anim_settings
+
     def _determine_audio_workers(self) -> int:
         """Compatibility helper retained for tests and external monkeypatches."""
         return self._resolve_audio_worker_policy().resolved
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -102,9 +103,11 @@ class MouthSegmentLoader:
             }
 
             async def creator(output_path: Path) -> Path:
+                # RMS解析は同期処理のため、先行中の音声生成タスクを止めないようスレッドで行う
+                segments = await asyncio.to_thread(self._compute, audio_path)
                 output_path.write_text(
                     json.dumps(
-                        {"segments": self._compute(audio_path)},
+                        {"segments": segments},
                         ensure_ascii=False,
                     ),
                     encoding="utf-8",
@@ -121,7 +124,7 @@ class MouthSegmentLoader:
             return payload.get("segments", [])
         except Exception:
             try:
-                return self._compute(audio_path)
+                return await asyncio.to_thread(self._compute, audio_path)
             except Exception as exc:
                 logger.debug(
                     "Mouth timeline computation failed for %s: %s",
@@ -252,7 +255,7 @@ async def build_face_animation(
     voice_layer_segments: List[Dict[str, Any]],
 ) -> Optional[Any]:
     """Return per-layer or single-target face animation metadata."""
-    settings = FaceAnimSettings.from_config(phase.config)
+    settings = phase.face_anim_settings()
     loader = MouthSegmentLoader(phase, line_id, settings)
     voice_layers = [
         layer for layer in (line.get("voice_layers") or []) if isinstance(layer, dict)
@@ -68,15 +68,19 @@ class AudioPhaseRunMixin:
                     incoming_audio_overlays=incoming_audio_overlays,
                 )
                 if non_speech is not None:
-                    progress.set_description(non_speech.progress_description)
+                    progress.set_description(
+                        non_speech.progress_description, refresh=False
+                    )
                     line_data_map[non_speech.line_id] = non_speech.line_data
                     progress.update(1)
                     continue
 
+                # 説明文の更新では再描画せず、update() 側の間引かれた再描画に任せる
                 progress.set_description(
                     "Audio Generation "
                     f"(Scene '{entry['scene_id']}', Line {entry['line_idx']}: "
-                    f"'{entry['display_text'][:30]}...')"
+                    f"'{entry['display_text'][:30]}...')",
+                    refresh=False,
                 )
                 result = await process_speech_entry(
                     phase=self,
@@ -55,17 +55,13 @@ def _ensure_line_audio_cache(
     if not needs_cache:
         return audio_path
 
-    phase.cache_manager.save_to_cache(
+    # save_to_cache は保存先パスを返すため、get_cache_path でキーを再計算しない
+    cached_path = phase.cache_manager.save_to_cache(
         key_data=cache_data,
         file_name=line_id,
         extension="wav",
         source_path=audio_path,
     )
-    cached_path = phase.cache_manager.get_cache_path(
-        key_data=cache_data,
-        file_name=line_id,
-        extension="wav",
-    )
     if cached_path.exists():
         return cached_path
     return phase.temp_dir / f"{line_id}_speech.wav"
@@ -9,6 +9,7 @@ import yaml
 from yaml import YAMLError
 
 from ...exceptions import ValidationError
+from ..config.io import SafeYamlLoader
 from ..markdown import load_markdown_script
 
 
@@ -237,7 +238,7 @@ class ScriptResolver:
 
         try:
             with path.open("r", encoding="utf-8") as fh:
-                return yaml.safe_load(fh) or {}
+                return yaml.load(fh, Loader=SafeYamlLoader) or {}
         except YAMLError as e:
             mark = getattr(e, "mark", None)
             line = mark.line + 1 if mark else None
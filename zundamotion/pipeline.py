@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 from tqdm import tqdm
 
 from .cache import CacheManager
+from .components.audio.voicevox_client import voicevox_session
 from .components.pipeline_phases import AudioPhase, BGMPhase, FinalizePhase, VideoPhase
 from .exceptions import PipelineError
 from .timeline import Timeline
@@ -166,275 +167,284 @@ class GenerationPipeline(PipelineReportingMixin):
         if temp_ctx is None:
             temp_ctx = tempfile.TemporaryDirectory()
 
-        with temp_ctx as temp_dir_str:
-            temp_dir = Path(temp_dir_str)
-            # Route ephemeral (no-cache) outputs to temp_dir for this run
-            try:
-                self.cache_manager.set_ephemeral_dir(temp_dir)
-            except Exception:
-                pass
-            if isinstance(logger, KVLogger):
-                logger.kv_info(
-                    f"Using temporary directory: {temp_dir}",
-                    kv_pairs={"TempDir": str(temp_dir)},
-                )
-                logger.kv_info(
-                    f"Using persistent cache directory: {self.cache_manager.cache_dir}",
-                    kv_pairs={"CacheDir": str(self.cache_manager.cache_dir)},
-                )
-            else:
-                logger.info(f"Using temporary directory: {temp_dir}")
-                logger.info(
-                    f"Using persistent cache directory: {self.cache_manager.cache_dir}"
-                )
+        try:
+            with temp_ctx as temp_dir_str:
+                temp_dir = Path(temp_dir_str)
+                # Route ephemeral (no-cache) outputs to temp_dir for this run
+                try:
+                    self.cache_manager.set_ephemeral_dir(temp_dir)
+                except Exception:
+                    pass
+                if isinstance(logger, KVLogger):
+                    logger.kv_info(
+                        f"Using temporary directory: {temp_dir}",
+                        kv_pairs={"TempDir": str(temp_dir)},
+                    )
+                    logger.kv_info(
+                        f"Using persistent cache directory: {self.cache_manager.cache_dir}",
+                        kv_pairs={"CacheDir": str(self.cache_manager.cache_dir)},
+                    )
+                else:
+                    logger.info(f"Using temporary directory: {temp_dir}")
+                    logger.info(
+                        f"Using persistent cache directory: {self.cache_manager.cache_dir}"
+                    )
 
-            script = self.config.get("script", {})
-            scenes = script.get("scenes", [])
+                script = self.config.get("script", {})
+                scenes = script.get("scenes", [])
 
-            # Phase 1: Audio Generation
-            audio_phase = AudioPhase(
-                self.config, temp_dir, self.cache_manager, self.audio_params
-            )
-            line_data_map, used_voicevox_info = await self._run_phase(
-                "AudioPhase", audio_phase.run, scenes, self.timeline
-            )
+                # Phase 1: Audio Generation
+                audio_phase = AudioPhase(
+                    self.config, temp_dir, self.cache_manager, self.audio_params
+                )
+                # VOICEVOX への keep-alive 接続は音声フェーズ以降使わない
+                async with voicevox_session():
+                    line_data_map, used_voicevox_info = await self._run_phase(
+                        "AudioPhase", audio_phase.run, scenes, self.timeline
+                    )
 
-            # Phase 2: Video Generation
-            video_phase = await VideoPhase.create(
-                self.config,
-                temp_dir,
-                self.cache_manager,
-                self.jobs,
-                self.hw_encoder,
-                video_params=self.video_params,
-                audio_params=self.audio_params,
-            )
-            all_clips = await self._run_phase(
-                "VideoPhase", video_phase.run, scenes, line_data_map, self.timeline
-            )
-            video_renderer = getattr(video_phase, "video_renderer", None)
-            self.stats["filter_path_usage"] = getattr(
-                video_renderer, "path_counters", {}
-            )
-            self.stats["subtitle_overlay"] = getattr(
-                video_renderer, "subtitle_overlay_stats", {}
-            )
-            self.stats["subtitle_overlay_history"] = getattr(
-                video_renderer, "subtitle_overlay_stats_history", []
-            )
-            generate_no_sub_video = bool(
-                self.config.get("system", {}).get("generate_no_sub_video", False)
-            )
-            no_sub_clips = (
-                self._derive_no_subtitle_clips(all_clips)
-                if generate_no_sub_video
-                else []
-            )
-            self.stats["clips_processed"] = len(all_clips)
-            # all_clips が Path オブジェクトのリストであると仮定し、get_media_duration を使用して duration を取得
-            # get_media_duration は非同期関数なので、asyncio.gather を使って並行して duration を取得
-            clip_durations_tasks = [
-                self.cache_manager.get_or_create_media_duration(
-                    clip,
-                    caller="pipeline_clip_duration",
+                # Phase 2: Video Generation
+                video_phase = await VideoPhase.create(
+                    self.config,
+                    temp_dir,
+                    self.cache_manager,
+                    self.jobs,
+                    self.hw_encoder,
+                    video_params=self.video_params,
+                    audio_params=self.audio_params,
                 )
-                for clip in all_clips
-            ]
-            self.stats["clip_durations"] = await asyncio.gather(*clip_durations_tasks)
-            # Phase 3: Finalize Video
-            finalize_phase = FinalizePhase(
-                self.config,
-                temp_dir,
-                self.cache_manager,
-                self.video_params,
-                self.audio_params,
-                self.hw_encoder,
-                self.quality,
-                final_copy_only=self.final_copy_only,
-            )
-            final_video_path = await self._run_phase(
-                "FinalizePhase",
-                finalize_phase.run,
-                scenes,
-                self.timeline,
-                line_data_map,
-                all_clips,
-                used_voicevox_info,
-                "final_output",
-            )
-            no_sub_final_video_path = None
-            if no_sub_clips:
-                no_sub_final_video_path = await self._run_phase(
+                all_clips = await self._run_phase(
+                    "VideoPhase", video_phase.run, scenes, line_data_map, self.timeline
+                )
+                video_renderer = getattr(video_phase, "video_renderer", None)
+                self.stats["filter_path_usage"] = getattr(
+                    video_renderer, "path_counters", {}
+                )
+                self.stats["subtitle_overlay"] = getattr(
+                    video_renderer, "subtitle_overlay_stats", {}
+                )
+                self.stats["subtitle_overlay_history"] = getattr(
+                    video_renderer, "subtitle_overlay_stats_history", []
+                )
+                generate_no_sub_video = bool(
+                    self.config.get("system", {}).get("generate_no_sub_video", False)
+                )
+                no_sub_clips = (
+                    self._derive_no_subtitle_clips(all_clips)
+                    if generate_no_sub_video
+                    else []
+                )
+                self.stats["clips_processed"] = len(all_clips)
+                # all_clips が Path オブジェクトのリストであると仮定し、get_media_duration を使用して duration を取得
+                # get_media_duration は非同期関数なので、asyncio.gather を使って並行して duration を取得
+                clip_durations_tasks = [
+                    self.cache_manager.get_or_create_media_duration(
+                        clip,
+                        caller="pipeline_clip_duration",
+                    )
+                    for clip in all_clips
+                ]
+                self.stats["clip_durations"] = await asyncio.gather(*clip_durations_tasks)
+                # Phase 3: Finalize Video
+                finalize_phase = FinalizePhase(
+                    self.config,
+                    temp_dir,
+                    self.cache_manager,
+                    self.video_params,
+                    self.audio_params,
+                    self.hw_encoder,
+                    self.quality,
+                    final_copy_only=self.final_copy_only,
+                )
+                final_video_path = await self._run_phase(
                     "FinalizePhase",
                     finalize_phase.run,
                     scenes,
                     self.timeline,
                     line_data_map,
-                    no_sub_clips,
+                    all_clips,
                     used_voicevox_info,
-                    "final_output_no_sub",
+                    "final_output",
                 )
-            # Phase 4: BGM Mixing (timeline driven)
-            bgm_phase = BGMPhase(self.config, temp_dir, self.audio_params)
-            final_video_path = await self._run_phase(
-                "BGMPhase",
-                bgm_phase.run,
-                final_video_path,
-                self.timeline,
-            )
-            if no_sub_final_video_path is not None:
-                no_sub_final_video_path = await self._run_phase(
+                no_sub_final_video_path = None
+                if no_sub_clips:
+                    no_sub_final_video_path = await self._run_phase(
+                        "FinalizePhase",
+                        finalize_phase.run,
+                        scenes,
+                        self.timeline,
+                        line_data_map,
+                        no_sub_clips,
+                        used_voicevox_info,
+                        "final_output_no_sub",
+                    )
+                # Phase 4: BGM Mixing (timeline driven)
+                bgm_phase = BGMPhase(self.config, temp_dir, self.audio_params)
+                final_video_path = await self._run_phase(
                     "BGMPhase",
                     bgm_phase.run,
-                    no_sub_final_video_path,
+                    final_video_path,
                     self.timeline,
                 )
-            # 最終的な動画をoutput_pathにコピー
-            shutil.copy(final_video_path, output_path)
-            await validate_final_media(output_path, self.audio_params)
-            if isinstance(logger, KVLogger):
-                logger.kv_info(
-                    f"Final video saved to {output_path}",
-                    kv_pairs={"OutputPath": str(output_path)},
-                )
-            else:
-                logger.info(f"Final video saved to {output_path}")
-            if no_sub_final_video_path is not None:
-                output_path_base = Path(output_path)
-                no_sub_output_path = output_path_base.with_name(
-                    f"{output_path_base.stem}_no_sub{output_path_base.suffix}"
-                )
-                shutil.copy(no_sub_final_video_path, no_sub_output_path)
-                logger.info(f"No-sub video saved to {no_sub_output_path}")
+                if no_sub_final_video_path is not None:
+                    no_sub_final_video_path = await self._run_phase(
+                        "BGMPhase",
+                        bgm_phase.run,
+                        no_sub_final_video_path,
+                        self.timeline,
+                    )
+                # 最終的な動画をoutput_pathにコピー
+                shutil.copy(final_video_path, output_path)
+                await validate_final_media(output_path, self.audio_params)
+                if isinstance(logger, KVLogger):
+                    logger.kv_info(
+                        f"Final video saved to {output_path}",
+                        kv_pairs={"OutputPath": str(output_path)},
+                    )
+                else:
+                    logger.info(f"Final video saved to {output_path}")
+                if no_sub_final_video_path is not None:
+                    output_path_base = Path(output_path)
+                    no_sub_output_path = output_path_base.with_name(
+                        f"{output_path_base.stem}_no_sub{output_path_base.suffix}"
+                    )
+                    shutil.copy(no_sub_final_video_path, no_sub_output_path)
+                    logger.info(f"No-sub video saved to {no_sub_output_path}")
 
-            # Save the timeline if enabled
-            timeline_config = self.config.get("system", {}).get("timeline", {})
-            if timeline_config.get("enabled", False):
-                timeline_format = timeline_config.get("format", "md")
-                output_path_base = Path(output_path)
+                # Save the timeline if enabled
+                timeline_config = self.config.get("system", {}).get("timeline", {})
+                if timeline_config.get("enabled", False):
+                    timeline_format = timeline_config.get("format", "md")
+                    output_path_base = Path(output_path)
 
-                if timeline_format in ["md", "both"]:
-                    timeline_output_path_md = output_path_base.with_suffix(".md")
-                    self.timeline.save_as_md(timeline_output_path_md)
-                    if isinstance(logger, KVLogger):
-                        logger.kv_info(
-                            f"Timeline saved to {timeline_output_path_md}",
-                            kv_pairs={"TimelinePathMD": str(timeline_output_path_md)},
-                        )
-                    else:
-                        logger.info(f"Timeline saved to {timeline_output_path_md}")
-                if timeline_format in ["csv", "both"]:
-                    timeline_output_path_csv = output_path_base.with_suffix(".csv")
-                    self.timeline.save_as_csv(timeline_output_path_csv)
-                    if isinstance(logger, KVLogger):
-                        logger.kv_info(
-                            f"Timeline saved to {timeline_output_path_csv}",
-                            kv_pairs={"TimelinePathCSV": str(timeline_output_path_csv)},
-                        )
-                    else:
-                        logger.info(f"Timeline saved to {timeline_output_path_csv}")
+                    if timeline_format in ["md", "both"]:
+                        timeline_output_path_md = output_path_base.with_suffix(".md")
+                        self.timeline.save_as_md(timeline_output_path_md)
+                        if isinstance(logger, KVLogger):
+                            logger.kv_info(
+                                f"Timeline saved to {timeline_output_path_md}",
+                                kv_pairs={"TimelinePathMD": str(timeline_output_path_md)},
+                            )
+                        else:
+                            logger.info(f"Timeline saved to {timeline_output_path_md}")
+                    if timeline_format in ["csv", "both"]:
+                        timeline_output_path_csv = output_path_base.with_suffix(".csv")
+                        self.timeline.save_as_csv(timeline_output_path_csv)
+                        if isinstance(logger, KVLogger):
+                            logger.kv_info(
+                                f"Timeline saved to {timeline_output_path_csv}",
+                                kv_pairs={"TimelinePathCSV": str(timeline_output_path_csv)},
+                            )
+                        else:
+                            logger.info(f"Timeline saved to {timeline_output_path_csv}")
 
-            # Save subtitle file if enabled
-            subtitle_file_config = self.config.get("system", {}).get(
-                "subtitle_file", {}
-            )
-            if subtitle_file_config.get("enabled", False):
-                subtitle_format = subtitle_file_config.get("format", "srt")
-                subtitle_offset = float(subtitle_file_config.get("offset_seconds", 0.0) or 0.0)
-                output_path_base = Path(output_path)
+                # Save subtitle file if enabled
+                subtitle_file_config = self.config.get("system", {}).get(
+                    "subtitle_file", {}
+                )
+                if subtitle_file_config.get("enabled", False):
+                    subtitle_format = subtitle_file_config.get("format", "srt")
+                    subtitle_offset = float(subtitle_file_config.get("offset_seconds", 0.0) or 0.0)
+                    output_path_base = Path(output_path)
 
-                if subtitle_format in ["srt", "both"]:
-                    subtitle_output_path_srt = output_path_base.with_suffix(".srt")
-                    self.timeline.save_subtitles(
-                        subtitle_output_path_srt,
-                        format="srt",
-                        offset_seconds=subtitle_offset,
-                    )
-                    if isinstance(logger, KVLogger):
-                        logger.kv_info(
-                            f"Subtitle file saved to {subtitle_output_path_srt}",
-                            kv_pairs={"SubtitlePathSRT": str(subtitle_output_path_srt)},
+                    if subtitle_format in ["srt", "both"]:
+                        subtitle_output_path_srt = output_path_base.with_suffix(".srt")
+                        self.timeline.save_subtitles(
+                            subtitle_output_path_srt,
+                            format="srt",
+                            offset_seconds=subtitle_offset,
                         )
-                    else:
-                        logger.info(
-                            f"Subtitle file saved to {subtitle_output_path_srt}"
+                        if isinstance(logger, KVLogger):
+                            logger.kv_info(
+                                f"Subtitle file saved to {subtitle_output_path_srt}",
+                                kv_pairs={"SubtitlePathSRT": str(subtitle_output_path_srt)},
+                            )
+                        else:
+                            logger.info(
+                                f"Subtitle file saved to {subtitle_output_path_srt}"
+                            )
+                    if subtitle_format in ["ass", "both"]:
+                        subtitle_output_path_ass = output_path_base.with_suffix(".ass")
+                        self.timeline.save_subtitles(
+                            subtitle_output_path_ass,
+                            format="ass",
+                            offset_seconds=subtitle_offset,
                         )
-                if subtitle_format in ["ass", "both"]:
-                    subtitle_output_path_ass = output_path_base.with_suffix(".ass")
-                    self.timeline.save_subtitles(
-                        subtitle_output_path_ass,
-                        format="ass",
-                        offset_seconds=subtitle_offset,
-                    )
+                        if isinstance(logger, KVLogger):
+                            logger.kv_info(
+                                f"Subtitle file saved to {subtitle_output_path_ass}",
+                                kv_pairs={"SubtitlePathASS": str(subtitle_output_path_ass)},
+                            )
+                        else:
+                            logger.info(
+                                f"Subtitle file saved to {subtitle_output_path_ass}"
+                            )
+
+                topics = self.timeline.get_topics()
+                if topics:
+                    formatted_topics = [
+                        f"{self.timeline.format_chapter_timestamp(t['time'])} {t['title']}"
+                        for t in topics
+                    ]
+                    logger.info("Topics: %s", formatted_topics)
+                    output_path_base = Path(output_path)
+                    chapters_output_path = output_path_base.with_suffix(".chapters.txt")
+                    self.timeline.save_chapters(chapters_output_path)
                     if isinstance(logger, KVLogger):
                         logger.kv_info(
-                            f"Subtitle file saved to {subtitle_output_path_ass}",
-                            kv_pairs={"SubtitlePathASS": str(subtitle_output_path_ass)},
+                            f"Chapters saved to {chapters_output_path}",
+                            kv_pairs={"ChaptersPath": str(chapters_output_path)},
                         )
                     else:
-                        logger.info(
-                            f"Subtitle file saved to {subtitle_output_path_ass}"
+                        logger.info(f"Chapters saved to {chapters_output_path}")
+
+                    try:
+                        video_duration = await get_media_duration(
+                            str(final_video_path),
+                            caller="timeline_ffmetadata_duration",
                         )
+                        ffmetadata_output_path = output_path_base.with_suffix(".ffmetadata")
+                        with open(ffmetadata_output_path, "w", encoding="utf-8") as f:
+                            f.write(";FFMETADATA1\n")
+                            for idx, topic in enumerate(topics):
+                                start_ms = int(float(topic["time"]) * 1000)
+                                if idx + 1 < len(topics):
+                                    end_ms = int(float(topics[idx + 1]["time"]) * 1000)
+                                else:
+                                    end_ms = int(float(video_duration) * 1000)
+                                if end_ms <= start_ms:
+                                    end_ms = start_ms + 1
+                                f.write("[CHAPTER]\n")
+                                f.write("TIMEBASE=1/1000\n")
+                                f.write(f"START={start_ms}\n")
+                                f.write(f"END={end_ms}\n")
+                                f.write(f"title={topic['title']}\n")
+                        logger.info(f"FFmetadata saved to {ffmetadata_output_path}")
+                    except Exception as e:
+                        logger.debug("Failed to save ffmetadata: %s", e)
+
+                pipeline_end_time = time.time()
+                self.stats["total_duration"] = pipeline_end_time - pipeline_start_time
+                perf.scan_intermediates(temp_dir)
+                self.stats["perf_summary"] = perf.to_dict()
+
+                # Output final summary
+                self._log_final_summary()
+                self._write_perf_summary_json(Path(output_path), perf)
 
-            topics = self.timeline.get_topics()
-            if topics:
-                formatted_topics = [
-                    f"{self.timeline.format_chapter_timestamp(t['time'])} {t['title']}"
-                    for t in topics
-                ]
-                logger.info("Topics: %s", formatted_topics)
-                output_path_base = Path(output_path)
-                chapters_output_path = output_path_base.with_suffix(".chapters.txt")
-                self.timeline.save_chapters(chapters_output_path)
                 if isinstance(logger, KVLogger):
                     logger.kv_info(
-                        f"Chapters saved to {chapters_output_path}",
-                        kv_pairs={"ChaptersPath": str(chapters_output_path)},
+                        "--- Video Generation Pipeline Completed ---",
+                        kv_pairs={"Event": "PipelineCompleted"},
                     )
                 else:
-                    logger.info(f"Chapters saved to {chapters_output_path}")
-
-                try:
-                    video_duration = await get_media_duration(
-                        str(final_video_path),
-                        caller="timeline_ffmetadata_duration",
-                    )
-                    ffmetadata_output_path = output_path_base.with_suffix(".ffmetadata")
-                    with open(ffmetadata_output_path, "w", encoding="utf-8") as f:
-                        f.write(";FFMETADATA1\n")
-                        for idx, topic in enumerate(topics):
-                            start_ms = int(float(topic["time"]) * 1000)
-                            if idx + 1 < len(topics):
-                                end_ms = int(float(topics[idx + 1]["time"]) * 1000)
-                            else:
-                                end_ms = int(float(video_duration) * 1000)
-                            if end_ms <= start_ms:
-                                end_ms = start_ms + 1
-                            f.write("[CHAPTER]\n")
-                            f.write("TIMEBASE=1/1000\n")
-                            f.write(f"START={start_ms}\n")
-                            f.write(f"END={end_ms}\n")
-                            f.write(f"title={topic['title']}\n")
-                    logger.info(f"FFmetadata saved to {ffmetadata_output_path}")
-                except Exception as e:
-                    logger.debug("Failed to save ffmetadata: %s", e)
-
-            pipeline_end_time = time.time()
-            self.stats["total_duration"] = pipeline_end_time - pipeline_start_time
-            perf.scan_intermediates(temp_dir)
-            self.stats["perf_summary"] = perf.to_dict()
-
-            # Output final summary
-            self._log_final_summary()
-            self._write_perf_summary_json(Path(output_path), perf)
-
-            if isinstance(logger, KVLogger):
-                logger.kv_info(
-                    "--- Video Generation Pipeline Completed ---",
-                    kv_pairs={"Event": "PipelineCompleted"},
-                )
-            else:
-                logger.info("--- Video Generation Pipeline Completed ---")
+                    logger.info("--- Video Generation Pipeline Completed ---")
+        finally:
+            # 実行中に間引いたキャッシュ容量/TTL の整理は、失敗時も含めてここでまとめて行う
+            try:
+                self.cache_manager.flush_cache_cleanup()
+            except Exception as e:
+                logger.warning("Deferred cache cleanup failed: %s", e)
 
 # Imported after GenerationPipeline is defined to preserve the public import path.
 from .pipeline_entry import run_generation
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, List, Tuple
 
 from zundamotion.components.audio import get_speakers_info
@@ -17,7 +18,8 @@ def generate_voice_report(
         output_filepath (str): The path to save the voice report Markdown file.
         voicevox_url (str): The base URL of the VOICEVOX engine.
     """
-    speaker_info = get_speakers_info(voicevox_url)
+    # get_speakers_info は呼び出しごとに接続を閉じる
+    speaker_info = asyncio.run(get_speakers_info(voicevox_url))
 
     report_lines = ["# 📋 VOICEVOX 使用情報レポート\n", "---\n"]
 
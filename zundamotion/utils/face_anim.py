@@ -7,12 +7,22 @@ from __future__ import annotations
 
 import contextlib
 import hashlib
+import operator
 import random
+import sys
 import wave
+from array import array
 from pathlib import Path
 from typing import Dict, List, Optional
 import struct
 
+# array で一括デコードできるPCM幅 -> (typecode, 無音中心のオフセット, 正規化係数)
+_ARRAY_PCM_FORMATS = {
+    1: ("B", 128, 128.0),
+    2: ("h", 0, 32768.0),
+    4: ("i", 0, float(1 << 31)),
+}
+
 
 def _wav_to_mono_samples(path: Path) -> tuple[List[float], int]:
     """Decode a PCM WAV into mono float samples and return (samples, sample_rate).
@@ -29,6 +39,10 @@ def _wav_to_mono_samples(path: Path) -> tuple[List[float], int]:
     if nframes == 0 or sr <= 0:
         return [], sr
 
+    fast = _array_mono_samples(raw, sw, nch)
+    if fast is not None:
+        return fast, sr
+
     # Helper to iterate per-frame samples across channels
     samples: List[float] = []
     frame_bytes = sw * nch
@@ -73,6 +87,29 @@ def _wav_to_mono_samples(path: Path) -> tuple[List[float], int]:
     return samples, sr
 
 
+def _array_mono_samples(raw: bytes, sw: int, nch: int) -> Optional[List[float]]:
+    """Decode 8/16/32-bit PCM via array (C loop) instead of per-frame struct calls."""
+    fmt = _ARRAY_PCM_FORMATS.get(sw)
+    if fmt is None or nch <= 0:
+        return None
+    typecode, offset, max_abs = fmt
+    pcm = array(typecode)
+    if pcm.itemsize != sw:
+        return None
+    frame_bytes = sw * nch
+    pcm.frombytes(raw[: len(raw) - (len(raw) % frame_bytes)])
+    if sw > 1 and sys.byteorder != "little":
+        pcm.byteswap()
+    if nch == 1:
+        if offset:
+            return [(v - offset) / max_abs for v in pcm]
+        return [v / max_abs for v in pcm]
+    channels = [pcm[ch::nch] for ch in range(nch)]
+    return [
+        (sum(frame) - offset * nch) / nch / max_abs for frame in zip(*channels)
+    ]
+
+
 def compute_mouth_timeline(
     audio_path: Path,
     fps: int = 15,
@@ -109,9 +146,7 @@ def compute_mouth_timeline(
             continue
         seg = samples[start:end]
         # Compute RMS
-        s2 = 0.0
-        for v in seg:
-            s2 += v * v
+        s2 = sum(map(operator.mul, seg, seg))
         rms = (s2 / (end - start)) ** 0.5
         rms_vals.append(rms)
     max_rms = max(rms_vals) if rms_vals else 0.0
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import os
+import re
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import subprocess
+import tempfile
 
-from .ffmpeg_capabilities import _threading_flags
+from .ffmpeg_capabilities import _threading_flags, get_ffmpeg_version
 from .ffmpeg_hw import get_profile_flags
 from .ffmpeg_params import AudioParams
 from .ffmpeg_probe import get_audio_duration, get_media_duration, get_media_info
@@ -17,6 +21,29 @@ from .filter_presets import get_audio_filter_chain
 
 INTERMEDIATE_AUDIO_FORMAT_VERSION = "pcm_s16le_wav_v1"
 AUDIO_MIX_VERSION = "pcm_mix_v1"
+# これを超える入力数のミックスはフィルタグラフをファイルで渡す
+_MIX_FILTER_SCRIPT_TRACK_THRESHOLD = 8
+# -filter_complex_script は ffmpeg 7.1 で非推奨になり、同版から -/filter_complex <file> が使える
+_FILTER_FILE_OPTION_MIN_VERSION = (7, 1)
+_FILTER_FILE_OPTION_CACHE: Dict[str, str] = {}
+_RELEASE_VERSION_PATTERN = re.compile(r"^n?(\d+)\.(\d+)")
+
+
+async def _filter_complex_file_option(ffmpeg_path: str) -> str:
+    """フィルタグラフをファイルから読ませるオプション名を ffmpeg の版に合わせて返す。"""
+    cached = _FILTER_FILE_OPTION_CACHE.get(ffmpeg_path)
+    if cached is not None:
+        return cached
+    option = "-filter_complex_script"
+    version = await get_ffmpeg_version(ffmpeg_path) or ""
+    match = _RELEASE_VERSION_PATTERN.match(version)
+    if version.startswith("N-"):
+        # git ビルドは版番号を持たないため、現行 master とみなす
+        option = "-/filter_complex"
+    elif match and (int(match.group(1)), int(match.group(2))) >= _FILTER_FILE_OPTION_MIN_VERSION:
+        option = "-/filter_complex"
+    _FILTER_FILE_OPTION_CACHE[ffmpeg_path] = option
+    return option
 
 
 async def has_audio_stream(file_path: str) -> bool:
@@ -342,12 +369,29 @@ async def mix_audio_tracks(
         mix_in = "".join(f"[a{i}]" for i in range(len(audio_tracks)))
         parts.append(f"{mix_in}amix=inputs={len(audio_tracks)}:dropout_transition=0[aout]")
 
-        cmd.extend(["-filter_complex", ";".join(parts), "-map", "[aout]"])
+        filter_graph = ";".join(parts)
+        script_path: Optional[Path] = None
+        if len(audio_tracks) > _MIX_FILTER_SCRIPT_TRACK_THRESHOLD:
+            # 入力が多いとコマンドラインが長くなるため、フィルタグラフはファイルで渡す。
+            # 出力先はキャッシュディレクトリのこともあるので、一時ディレクトリに置く
+            option = await _filter_complex_file_option(ffmpeg_path)
+            fd, script_name = tempfile.mkstemp(suffix=".filtergraph.txt")
+            script_path = Path(script_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(filter_graph)
+            cmd.extend([option, str(script_path)])
+        else:
+            cmd.extend(["-filter_complex", filter_graph])
+        cmd.extend(["-map", "[aout]"])
         cmd.extend(intermediate.to_ffmpeg_opts())
         cmd.extend(["-t", str(total_duration), output_path])
 
         logger.debug(f"FFmpeg command: {' '.join(cmd)}")
-        proc = await _run_ffmpeg_async(cmd)
+        try:
+            proc = await _run_ffmpeg_async(cmd)
+        finally:
+            if script_path is not None:
+                script_path.unlink(missing_ok=True)
         logger.debug(f"FFmpeg stdout:\n{proc.stdout}")
         logger.debug(f"FFmpeg stderr:\n{proc.stderr}")
         logger.info(
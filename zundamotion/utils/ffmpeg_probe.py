@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import json
 import subprocess
+import wave
 from pathlib import Path
 from typing import Any, Dict, Optional, TypedDict
 
@@ -85,6 +86,15 @@ def _stat_key(path: Path) -> tuple[str, int, int]:
     return (str(path.resolve()), int(st.st_mtime), st.st_size)
 
 
+def read_wav_duration(file_path: Path) -> float:
+    """PCM WAV のヘッダから長さ(秒)を読む。読めない場合は例外を送出する。"""
+    with wave.open(str(file_path), "rb") as reader:
+        frame_rate = int(reader.getframerate())
+        if frame_rate <= 0:
+            raise ValueError("WAV frame rate must be positive")
+        return float(reader.getnframes()) / float(frame_rate)
+
+
 def clear_probe_caches() -> None:
     """同一プロセス内の ffprobe / 画像メタデータメモをクリアする。"""
     _media_info_memo.clear()
@@ -162,6 +172,16 @@ def _parse_media_probe(payload: Dict[str, Any]) -> MediaInfo:
     raw_duration = (payload.get("format") or {}).get("duration")
     if raw_duration not in {None, "", "N/A"}:
         media_info["duration"] = round(float(raw_duration), 2)
+    else:
+        # format duration が無いコンテナでも stream duration があれば
+        # 追加の duration-only ffprobe を起動せずに済ませる。
+        stream_durations = [
+            float(stream["duration"])
+            for stream in payload.get("streams", [])
+            if stream.get("duration") not in {None, "", "N/A"}
+        ]
+        if stream_durations:
+            media_info["duration"] = round(max(stream_durations), 2)
     return media_info
 
 
@@ -358,7 +378,13 @@ async def _get_duration(
 
 
 async def get_audio_duration(file_path: str, caller: Optional[str] = None) -> float:
-    """音声ファイルの長さ(秒)を返す。"""
+    """音声ファイルの長さ(秒)を返す。PCM WAV はヘッダから読み ffprobe を起動しない。"""
+    if Path(file_path).suffix.lower() == ".wav":
+        try:
+            # ffprobe 経由の値と揃えるため同じく 10ms 単位に丸める
+            return round(read_wav_duration(Path(file_path)), 2)
+        except (OSError, EOFError, ValueError, wave.Error):
+            pass
     try:
         return await _get_duration(file_path, kind="aud", caller=caller)
     except Exception as exc: